@@ -0,0 +1,5 @@
+"""
+Load tests of the API: synthetic datasets and in-process concurrent clients.
+
+Usage: python -m benchmarks --help
+"""
@@ -0,0 +1,151 @@
+"""
+Generate a dataset and load-test the API in-process, writing a JSON report.
+
+Usage: python -m benchmarks [options]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from dataclasses import fields
+from datetime import datetime, timezone
+from pathlib import Path
+
+DEFAULT_SCENARIOS = (
+    "create_appeal",
+    "list_operators",
+    "statistics_operators",
+    "statistics_sources",
+    "statistics_timeline",
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument(
+        "--database-url",
+        help="database to benchmark (default: new SQLite file in the temp directory)",
+    )
+    parser.add_argument(
+        "--reuse-dataset",
+        action="store_true",
+        help="benchmark existing database contents instead of generating a dataset",
+    )
+    parser.add_argument("--operators", type=int, default=1000)
+    parser.add_argument("--sources", type=int, default=100)
+    parser.add_argument("--operators-per-source", type=int, default=20)
+    parser.add_argument("--leads", type=int, default=100000)
+    parser.add_argument("--appeals", type=int, default=1000000)
+    parser.add_argument("--active-ratio", type=float, default=0.02)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(DEFAULT_SCENARIOS),
+        help=f"comma-separated scenarios (default: all of {', '.join(DEFAULT_SCENARIOS)})",
+    )
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent clients")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests per scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--async", dest="async_mode", action="store_true", help="serve with DATABASE_ASYNC=true"
+    )
+    parser.add_argument(
+        "--statistics-cache-ttl",
+        type=float,
+        default=0.0,
+        help="STATISTICS_CACHE_TTL for the run (default 0: every request hits the database)",
+    )
+    parser.add_argument("--output", help="JSON report path (default: stdout)")
+
+    args = parser.parse_args(argv)
+    args.scenarios = [name for name in args.scenarios.split(",") if name]
+    if args.leads < 1 or args.sources < 1 or args.operators < 1:
+        parser.error("--operators, --sources and --leads must be positive")
+    return args
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{Path(tempfile.gettempdir()) / 'crm_leads_benchmark.db'}"
+    # Settings and engines are created on import: configure them first
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["DATABASE_ASYNC"] = str(args.async_mode)
+    os.environ["STATISTICS_CACHE_TTL"] = str(args.statistics_cache_ttl)
+
+    from benchmarks import runner
+    from src import dataset
+    from src.config import settings
+    from src.database import engine, init_db
+
+    unknown = set(args.scenarios) - set(runner.SCENARIOS)
+    if unknown:
+        sys.exit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    def log(message: str) -> None:
+        print(message, file=sys.stderr)
+
+    init_db()
+    if args.reuse_dataset:
+        dataset_report = {"reused": True}
+    else:
+        config = dataset.DatasetConfig(
+            **{f.name: getattr(args, f.name) for f in fields(dataset.DatasetConfig)}
+        )
+        log(f"Generating dataset in {database_url}")
+        dataset_report = dataset.generate(engine, config, log=log)
+        log(f"Dataset generated in {dataset_report['seconds']}s")
+
+    info = dataset.count_rows(engine)
+    if not info["sources"]:
+        sys.exit("Database has no sources: generate a dataset first")
+    results = asyncio.run(
+        runner.run(
+            args.scenarios,
+            runner.DatasetInfo(leads=info["leads"], sources=info["sources"]),
+            requests=args.requests,
+            concurrency=args.concurrency,
+            warmup=args.warmup,
+            seed=args.seed,
+            log=log,
+        )
+    )
+
+    report = {
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "settings": settings.model_dump(
+            include={"database_async", "appeal_intake_mode", "statistics_cache_ttl"}
+        ),
+        "dataset": {**dataset_report, "rows": info},
+        "scenarios": results,
+    }
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+        log(f"Report written to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Concurrent in-process clients driving the ASGI app, with latency and SQL statement stats."""
+
+import asyncio
+import random
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import httpx
+
+from src.main import app
+from src.services.profiling import RequestProfile, current_profile, sql_profiler
+
+# Request built by scenario: (method, url, JSON body or None)
+Request = tuple[str, str, dict | None]
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    build: Callable[[random.Random, "DatasetInfo"], Request]
+
+
+@dataclass
+class DatasetInfo:
+    """What scenarios need to know about the dataset."""
+
+    leads: int
+    sources: int
+    new_leads: int = 0
+
+
+def create_appeal(rnd: random.Random, dataset: DatasetInfo) -> Request:
+    # Mostly returning leads, every fifth appeal comes from a new one
+    if rnd.random() < 0.2 or not dataset.leads:
+        dataset.new_leads += 1
+        external_id = f"bench-{dataset.new_leads}-{rnd.getrandbits(32)}"
+    else:
+        external_id = f"lead-{rnd.randint(1, dataset.leads)}"
+    return (
+        "POST",
+        "/appeals",
+        {
+            "lead_external_id": external_id,
+            "source_id": rnd.randint(1, dataset.sources),
+            "message": "Benchmark appeal",
+        },
+    )
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario("create_appeal", "POST /appeals", create_appeal),
+        Scenario("list_operators", "GET /operators", lambda rnd, _: ("GET", "/operators", None)),
+        Scenario(
+            "statistics_operators",
+            "GET /statistics/operators",
+            lambda rnd, _: ("GET", "/statistics/operators", None),
+        ),
+        Scenario(
+            "statistics_sources",
+            "GET /statistics/sources",
+            lambda rnd, _: ("GET", "/statistics/sources", None),
+        ),
+        Scenario(
+            "statistics_timeline",
+            "GET /statistics/sources/timeline (last 24 hours)",
+            lambda rnd, _: ("GET", "/statistics/sources/timeline", None),
+        ),
+    ]
+}
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    rank = max(int(round(percent / 100 * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+def summarize(values: list[float], digits: int = 2) -> dict:
+    values = sorted(values)
+    return {
+        "mean": round(sum(values) / len(values), digits) if values else 0.0,
+        "p50": round(percentile(values, 50), digits),
+        "p95": round(percentile(values, 95), digits),
+        "p99": round(percentile(values, 99), digits),
+        "max": round(values[-1], digits) if values else 0.0,
+    }
+
+
+@dataclass
+class ScenarioResult:
+    latencies: list[float] = field(default_factory=list)
+    statements: list[int] = field(default_factory=list)
+    status_codes: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    seconds: float = 0.0
+
+    def report(self, concurrency: int) -> dict:
+        requests = len(self.latencies)
+        return {
+            "requests": requests,
+            "concurrency": concurrency,
+            "seconds": round(self.seconds, 3),
+            "throughput_rps": round(requests / self.seconds, 1) if self.seconds else 0.0,
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+            "errors": dict(self.errors),
+            "latency_ms": summarize(self.latencies),
+            "statements_per_request": summarize(self.statements),
+        }
+
+
+async def _send(client: httpx.AsyncClient, request: Request, result: ScenarioResult | None):
+    method, url, body = request
+    profile = RequestProfile()
+    token = current_profile.set(profile)
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, json=body)
+    except Exception as exc:
+        if result is not None:
+            result.errors[type(exc).__name__] += 1
+        return
+    finally:
+        current_profile.reset(token)
+
+    if result is not None:
+        result.latencies.append((time.perf_counter() - started) * 1000)
+        result.statements.append(profile.statements)
+        result.status_codes[response.status_code] += 1
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    dataset: DatasetInfo,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    rnd: random.Random,
+) -> dict:
+    """Send `requests` requests of scenario from `concurrency` concurrent clients."""
+    for _ in range(warmup):
+        await _send(client, scenario.build(rnd, dataset), None)
+
+    result = ScenarioResult()
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            await _send(client, scenario.build(rnd, dataset), result)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.seconds = time.perf_counter() - started
+    return result.report(concurrency)
+
+
+async def run(
+    scenarios: list[str],
+    dataset: DatasetInfo,
+    requests: int,
+    concurrency: int,
+    warmup: int = 20,
+    seed: int = 42,
+    log=print,
+) -> dict:
+    """Run scenarios one after another against the app (with its lifespan)."""
+    sql_profiler.install()
+    rnd = random.Random(seed)
+    results = {}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://benchmark", timeout=None
+        ) as client:
+            for name in scenarios:
+                results[name] = await run_scenario(
+                    client, SCENARIOS[name], dataset, requests, concurrency, warmup, rnd
+                )
+                log(
+                    f"{name}: {results[name]['throughput_rps']} req/s, "
+                    f"p95 {results[name]['latency_ms']['p95']} ms, "
+                    f"{results[name]['statements_per_request']['mean']} statements/request"
+                )
+
+    return results
@@ -1,11 +1,27 @@
+import argparse
 import random
 
-from src.database import SessionLocal, init_db
-from src.models import Appeal, Lead, Operator, OperatorSourceWeight, Source
+from src.database import SessionLocal, engine, init_db
+from src.dataset import DatasetConfig, generate
+from src.models import (
+    Appeal,
+    AppealArchive,
+    AppealCounter,
+    AppealRollup,
+    Lead,
+    Operator,
+    OperatorSourceWeight,
+    Source,
+)
+from src.services import AppealAssignmentService, AppealCounterService
+from src.services.routing import routing_cache
 
 
 def clear_database(db):
     """Clear all data from database."""
+    db.query(AppealRollup).delete()
+    db.query(AppealCounter).delete()
+    db.query(AppealArchive).delete()
     db.query(Appeal).delete()
     db.query(OperatorSourceWeight).delete()
     db.query(Lead).delete()
@@ -105,6 +121,8 @@ def create_weights(db, operators, sources):
         weight = OperatorSourceWeight(**weight_data)
         db.add(weight)
 
+    # Running app instances reload sources, operators and weights on the new version
+    routing_cache.bump_version(db)
     db.commit()
     print(f"  - Configured weights for {len(sources)} sources")
 
@@ -316,6 +334,9 @@ def create_appeals(db, leads, sources, operators):
         db.add(appeal)
         appeals.append(appeal)
 
+    db.flush()
+    AppealCounterService.rebuild(db)
+    AppealAssignmentService.recount_operator_loads(db)
     db.commit()
 
     # Статистика по операторам
@@ -329,8 +350,52 @@ def create_appeals(db, leads, sources, operators):
     return appeals
 
 
+def seed_scale(args):
+    """Generate large synthetic dataset with bulk inserts (see src.dataset)."""
+    config = DatasetConfig(
+        operators=args.operators,
+        sources=args.sources,
+        operators_per_source=args.operators_per_source,
+        leads=args.leads,
+        appeals=args.appeals,
+        active_ratio=args.active_ratio,
+        days=args.days,
+        seed=args.seed,
+    )
+    result = generate(engine, config, log=lambda message: print(f"  - {message}"))
+
+    print("\n" + "=" * 60)
+    print(f"DATABASE SEEDED SUCCESSFULLY in {result['seconds']}s")
+    print("=" * 60)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Seed database with test data")
+    parser.add_argument(
+        "--scale",
+        action="store_true",
+        help="generate synthetic dataset of given size instead of the demo data",
+    )
+    parser.add_argument("--operators", type=int, default=1000)
+    parser.add_argument("--sources", type=int, default=100)
+    parser.add_argument("--operators-per-source", type=int, default=20)
+    parser.add_argument("--leads", type=int, default=100000)
+    parser.add_argument("--appeals", type=int, default=1000000)
+    parser.add_argument(
+        "--active-ratio",
+        type=float,
+        default=0.02,
+        help="share of most recent appeals left active",
+    )
+    parser.add_argument("--days", type=int, default=30, help="days the appeals are spread over")
+    parser.add_argument("--seed", type=int, default=42, help="random seed")
+    return parser.parse_args()
+
+
 def main():
     """Main function to seed database."""
+    args = parse_args()
+
     print("=" * 60)
     print("SEEDING DATABASE WITH TEST DATA")
     print("=" * 60)
@@ -338,6 +403,10 @@ def main():
     # Initialize database
     init_db()
 
+    if args.scale:
+        seed_scale(args)
+        return
+
     # Create session
     db = SessionLocal()
 
@@ -0,0 +1,77 @@
+"""
+Maintenance commands.
+
+Usage: python -m src.cli <command>
+"""
+
+import argparse
+from datetime import timedelta
+
+from src import migrations
+from src.config import settings
+from src.database import SessionLocal, engine, init_db
+from src.services.appeal import AppealAssignmentService
+from src.services.archive import AppealArchiveService
+from src.services.counters import AppealCounterService
+
+
+def migrate(_: argparse.Namespace) -> None:
+    """Apply pending schema migrations."""
+    applied = migrations.upgrade(engine, log=print)
+    print(f"Applied {applied} migrations, schema version {migrations.HEAD}")
+
+
+def rebuild_counters(_: argparse.Namespace) -> None:
+    """Recompute statistics counters, hourly rollups and operator loads from appeals."""
+    init_db()
+    with SessionLocal() as db:
+        counters, rollups = AppealCounterService.rebuild(db)
+        operators = AppealAssignmentService.recount_operator_loads(db)
+        db.commit()
+    print(
+        f"Rebuilt {counters} appeal counters and {rollups} hourly rollups, "
+        f"recounted load of {operators} operators"
+    )
+
+
+def archive_appeals(args: argparse.Namespace) -> None:
+    """Move appeals closed longer than the retention age to the archive table."""
+    init_db()
+    with SessionLocal() as db:
+        moved = AppealArchiveService.archive_closed(
+            db, timedelta(days=args.older_than_days), args.batch_size
+        )
+    print(f"Archived {moved} appeals closed more than {args.older_than_days} days ago")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description=__doc__)
+    commands = parser.add_subparsers(required=True, metavar="command")
+
+    command = commands.add_parser("migrate", help=migrate.__doc__)
+    command.set_defaults(handler=migrate)
+
+    command = commands.add_parser("rebuild-counters", help=rebuild_counters.__doc__)
+    command.set_defaults(handler=rebuild_counters)
+
+    command = commands.add_parser("archive-appeals", help=archive_appeals.__doc__)
+    command.add_argument(
+        "--older-than-days",
+        type=float,
+        default=settings.appeal_retention_days,
+        help="retention age of closed appeals (default: APPEAL_RETENTION_DAYS)",
+    )
+    command.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.archive_batch_size,
+        help="appeals moved per transaction (default: ARCHIVE_BATCH_SIZE)",
+    )
+    command.set_defaults(handler=archive_appeals)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Application settings."""
+
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Settings loaded from environment variables and .env file."""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # Serve requests with AsyncEngine/AsyncSession (requires aiosqlite or asyncpg)
+    database_async: bool = False
+    database_url: str = "sqlite:///./crm_leads.db"
+    # Apply pending schema migrations on startup; when disabled, startup fails on an
+    # outdated schema and migrations are applied with `python -m src.cli migrate`
+    database_auto_migrate: bool = True
+    # Async driver URL; derived from DATABASE_URL when not set
+    async_database_url: str | None = None
+
+    # Read-only endpoints (listings, lookups, statistics, export) use a separate engine:
+    # this replica URL or, by default on SQLite, query-only connections to the same file
+    database_read_url: str | None = None
+    async_database_read_url: str | None = None
+    # Seconds of replica lag (PostgreSQL) after which reads go to the primary (unset: no bound)
+    database_read_max_lag: float | None = None
+
+    # Connection pool (file SQLite and PostgreSQL); overflow connections are closed when returned
+    database_pool_size: int = 20
+    database_max_overflow: int = 20
+    # Seconds a request waits for a free pooled connection
+    database_pool_timeout: float = 30.0
+
+    # SQLite pragmas applied on each connection: WAL lets readers work alongside the writer,
+    # synchronous=NORMAL is durable in WAL mode except for the last commits on power loss
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    # Milliseconds a connection waits for a locked database before "database is locked"
+    sqlite_busy_timeout: int = 30000
+    # Bytes of database file memory-mapped for reads (0 disables)
+    sqlite_mmap_size: int = 268435456
+    # Page cache per connection: pages if positive, KiB if negative. Every pooled connection
+    # has its own cache (reads are mostly served by mmap), so memory is up to
+    # cache x (pool size + overflow) x 2 engines (writer and read pool)
+    sqlite_cache_size: int = -4096
+
+    # PostgreSQL: test pooled connections before use (survives server restarts / idle drops)
+    postgres_pool_pre_ping: bool = True
+    # Seconds after which pooled connections are replaced (-1 keeps them)
+    postgres_pool_recycle: int = 1800
+    # Milliseconds a statement may run before it is cancelled by the server (0 disables)
+    postgres_statement_timeout: int = 30000
+
+    # Appeals closed longer than this are moved to appeals_archive by
+    # `python -m src.cli archive-appeals`, in transactions of archive_batch_size appeals
+    appeal_retention_days: int = 90
+    archive_batch_size: int = 1000
+
+    # "sync": POST /appeals assigns operator before responding (201)
+    # "deferred": POST /appeals persists appeal and responds 202, dispatcher assigns operator
+    appeal_intake_mode: Literal["sync", "deferred"] = "sync"
+    dispatcher_workers: int = 2
+    # Max accepted appeals waiting for assignment; POST /appeals returns 503 when exceeded
+    dispatcher_queue_size: int = 10000
+    dispatcher_batch_size: int = 100
+    # Seconds a worker waits to fill a micro-batch
+    dispatcher_batch_wait: float = 0.05
+
+    # Seconds a cached routing snapshot (sources, weights, operators) is used before
+    # its version is checked in database; changes made by other workers appear within it
+    routing_version_ttl: float = 1.0
+
+    # Seconds cached /statistics responses are served; changes committed by this
+    # worker invalidate them at once, changes of other workers within the TTL (0 disables)
+    statistics_cache_ttl: float = 5.0
+
+    # Time SQL statements of every request: `Server-Timing` header and GET /debug/profile
+    # ranking routes by database time over the last sql_profiling_window requests
+    sql_profiling: bool = False
+    sql_profiling_window: int = 1000
+
+
+settings = Settings()
@@ -1,18 +1,232 @@
-import os
+import logging
+import time
+from contextlib import asynccontextmanager
 
-from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import URL, Engine, create_engine, event, make_url, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
-from src.models.base import Base
+from src.config import settings
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
-SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./crm_leads.db")
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Seconds a measured replica lag is trusted before it is queried again
+REPLICA_LAG_CHECK_INTERVAL = 1.0
+
+
+def to_async_url(url: str) -> str:
+    """Database URL with the async driver of its backend."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+def get_async_database_url() -> str:
+    """Async driver URL: explicit setting or DATABASE_URL with async driver."""
+    return settings.async_database_url or to_async_url(settings.database_url)
+
+
+def get_async_database_read_url() -> str:
+    """Async driver URL of read-only sessions."""
+    return settings.async_database_read_url or to_async_url(settings.database_read_url)
+
+
+def is_memory_sqlite(url: URL) -> bool:
+    """In-memory SQLite database (single connection, no pool or file pragmas)."""
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(url: URL, read_only: bool = False) -> dict:
+    """create_engine keyword arguments of the database profile for URL."""
+    backend = url.get_backend_name()
+    options = {}
+    connect_args = {}
+
+    if not is_memory_sqlite(url):
+        options.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+        )
+
+    if backend == "sqlite":
+        if url.get_driver_name() == "pysqlite":
+            # Connections are used from threadpool threads
+            connect_args["check_same_thread"] = False
+    elif backend == "postgresql":
+        options.update(
+            pool_pre_ping=settings.postgres_pool_pre_ping,
+            pool_recycle=settings.postgres_pool_recycle,
+        )
+        server_settings = {}
+        if settings.postgres_statement_timeout:
+            server_settings["statement_timeout"] = str(settings.postgres_statement_timeout)
+        if read_only:
+            server_settings["default_transaction_read_only"] = "on"
+        if server_settings and url.get_driver_name() == "asyncpg":
+            connect_args["server_settings"] = server_settings
+        elif server_settings:
+            connect_args["options"] = " ".join(
+                f"-c {name}={value}" for name, value in server_settings.items()
+            )
+
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def sqlite_pragmas(url: URL, read_only: bool = False) -> list[str]:
+    """PRAGMA statements executed on each new SQLite connection."""
+    pragmas = [
+        f"PRAGMA query_only = {int(read_only)}",
+        f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout)}",
+        f"PRAGMA cache_size = {int(settings.sqlite_cache_size)}",
+    ]
+    if not is_memory_sqlite(url):
+        pragmas += [
+            f"PRAGMA journal_mode = {settings.sqlite_journal_mode}",
+            f"PRAGMA synchronous = {settings.sqlite_synchronous}",
+            f"PRAGMA mmap_size = {int(settings.sqlite_mmap_size)}",
+        ]
+    return pragmas
+
+
+def configure_engine(engine: Engine, url: URL, read_only: bool = False) -> None:
+    """Install connection hooks of the database profile on (sync) engine."""
+    if url.get_backend_name() != "sqlite":
+        return
+    pragmas = sqlite_pragmas(url, read_only)
+
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def create_db_engine(url: str, read_only: bool = False) -> Engine:
+    """Sync engine tuned by settings for the database backend."""
+    parsed = make_url(url)
+    engine = create_engine(parsed, **engine_options(parsed, read_only))
+    configure_engine(engine, parsed, read_only)
+    return engine
+
+
+def create_async_db_engine(url: str, read_only: bool = False):
+    """Async engine tuned by settings for the database backend."""
+    parsed = make_url(url)
+    engine = create_async_engine(parsed, **engine_options(parsed, read_only))
+    configure_engine(engine.sync_engine, parsed, read_only)
+    return engine
+
+
+def has_read_pool() -> bool:
+    """
+    Read-only sessions get their own engine: a replica (DATABASE_READ_URL) or,
+    for file SQLite, query-only connections to the same file (in WAL mode they
+    read alongside the writer). Otherwise they use the primary engine.
+    """
+    if settings.database_read_url:
+        return True
+    url = make_url(settings.database_url)
+    return url.get_backend_name() == "sqlite" and not is_memory_sqlite(url)
+
+
+class ReplicaLag:
+    """
+    Replication lag of a PostgreSQL read replica, queried at most once per
+    REPLICA_LAG_CHECK_INTERVAL. Reads fall back to the primary while it exceeds `max_lag`.
+    """
+
+    def __init__(self, engine: Engine, max_lag: float):
+        self.engine = engine
+        self.max_lag = max_lag
+        self._acceptable = True
+        self._checked_at: float | None = None
+
+    @property
+    def check_due(self) -> bool:
+        return (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= REPLICA_LAG_CHECK_INTERVAL
+        )
+
+    def measure(self) -> float:
+        """Seconds the replica is behind the primary (0 when it has replayed everything)."""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text(
+                    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+                    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+                    "END"
+                )
+            ).scalar_one()
+
+    def is_acceptable(self) -> bool:
+        """Whether reads may use the replica; an unreachable replica counts as stale."""
+        if self.check_due:
+            try:
+                lag = self.measure()
+                self._acceptable = lag <= self.max_lag
+                if not self._acceptable:
+                    logger.warning("Read replica lags %.1fs behind, reading from primary", lag)
+            except Exception:
+                logger.exception("Failed to measure read replica lag")
+                self._acceptable = False
+            self._checked_at = time.monotonic()
+        return self._acceptable
+
+    async def is_acceptable_async(self) -> bool:
+        if self.check_due:
+            return await run_in_threadpool(self.is_acceptable)
+        return self._acceptable
+
+
+engine = create_db_engine(settings.database_url)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+read_engine = engine
+if has_read_pool():
+    read_engine = create_db_engine(settings.database_read_url or settings.database_url, True)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Staleness bound applies to replicas only: query-only SQLite connections read the primary file
+replica_lag = None
+if (
+    settings.database_read_url
+    and settings.database_read_max_lag is not None
+    and read_engine.dialect.name == "postgresql"
+):
+    replica_lag = ReplicaLag(read_engine, settings.database_read_max_lag)
+
+async_engine = None
+AsyncSessionLocal = None
+async_read_engine = None
+AsyncReadSessionLocal = None
+
+if settings.database_async:
+    async_engine = create_async_db_engine(get_async_database_url())
+    # Objects stay usable after commit: lazy refresh is not possible outside greenlet context
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async_read_engine = async_engine
+    if settings.database_read_url:
+        async_read_engine = create_async_db_engine(get_async_database_read_url(), True)
+    elif has_read_pool():
+        async_read_engine = create_async_db_engine(get_async_database_url(), True)
+    AsyncReadSessionLocal = async_sessionmaker(
+        async_read_engine, autoflush=False, expire_on_commit=False
+    )
+
 
 def get_db():
     """Dependency for getting database session."""
@@ -23,6 +237,78 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for getting async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def read_session_factory() -> sessionmaker:
+    """Read-only session factory: the primary's while the replica lags too far behind."""
+    if replica_lag and not replica_lag.is_acceptable():
+        return SessionLocal
+    return ReadSessionLocal
+
+
+async def async_read_session_factory() -> async_sessionmaker:
+    """Async version of `read_session_factory`."""
+    if replica_lag and not await replica_lag.is_acceptable_async():
+        return AsyncSessionLocal
+    return AsyncReadSessionLocal
+
+
+def get_read_db():
+    """Dependency for getting read-only database session (replica or query-only pool)."""
+    session_factory = read_session_factory()
+    db = session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db():
+    """Dependency for getting read-only async database session."""
+    session_factory = await async_read_session_factory()
+    async with session_factory() as db:
+        yield db
+
+
+# Session dependencies used by routers, selected by DATABASE_ASYNC setting;
+# handlers that do not write use get_read_session
+get_session = get_async_db if settings.database_async else get_db
+get_read_session = get_async_read_db if settings.database_async else get_read_db
+DbSession = Session | AsyncSession
+
+
+@asynccontextmanager
+async def session_scope():
+    """Session of the configured kind for background tasks (outside of requests)."""
+    if settings.database_async:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        await run_in_threadpool(db.close)
+
+
 def init_db():
-    """Initialize database tables."""
-    Base.metadata.create_all(bind=engine)
+    """Bring database schema up to date (or check it when auto-migration is disabled)."""
+    # Imported here: migrations use services, which import this module
+    from src import migrations
+
+    if settings.database_auto_migrate:
+        migrations.upgrade(engine)
+    else:
+        migrations.check(engine)
+
+
+def dialect_insert(db: Session, table):
+    """INSERT construct of the session's dialect (supports ON CONFLICT on SQLite/PostgreSQL)."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
@@ -0,0 +1,233 @@
+"""Synthetic dataset of operators, sources, weights, leads and appeals, bulk-inserted with Core."""
+
+import random
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Engine, delete, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from src import models
+from src.services.appeal import AppealAssignmentService
+from src.services.counters import AppealCounterService
+from src.services.routing import routing_cache
+from src.services.sampler import AliasSampler
+
+# Rows per executemany statement
+CHUNK_SIZE = 10000
+
+
+@dataclass
+class DatasetConfig:
+    operators: int = 1000
+    sources: int = 100
+    # Weighted operators per source
+    operators_per_source: int = 20
+    leads: int = 100000
+    appeals: int = 1000000
+    # Share of most recent appeals that are still active (the rest are closed)
+    active_ratio: float = 0.02
+    # Appeals are spread evenly over this many days before now
+    days: int = 30
+    seed: int = 42
+
+
+def _chunks(rows, size: int = CHUNK_SIZE):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _insert(db: Session, model, rows) -> int:
+    """executemany of plain Core INSERT per chunk (no ORM bulk bookkeeping)."""
+    connection = db.connection()
+    statement = insert(model.__table__)
+    count = 0
+    for chunk in _chunks(rows):
+        connection.execute(statement, chunk)
+        count += len(chunk)
+    return count
+
+
+def _reset_sequences(db: Session, id_models) -> None:
+    """
+    Move PostgreSQL id sequences past ids inserted explicitly, so that the next rows
+    created by the application do not collide (SQLite takes max(rowid) + 1 itself).
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    for model in id_models:
+        table = model.__tablename__
+        db.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {table}"
+            )
+        )
+
+
+def clear(db: Session) -> None:
+    """Delete all rows of tables filled by `generate`."""
+    for table in (
+        models.AppealRollup,
+        models.AppealCounter,
+        models.AppealArchive,
+        models.Appeal,
+        models.OperatorSourceWeight,
+        models.Lead,
+        models.Source,
+        models.Operator,
+    ):
+        db.execute(delete(table))
+
+
+def generate(engine: Engine, config: DatasetConfig, log=print) -> dict:
+    """
+    Replace database contents with a dataset of given size and commit.
+    Active appeals are routed like AppealAssignmentService does (weighted sampler,
+    operators at max_load masked out); closed appeals are routed by weight only.
+    Returns row counts and generation time.
+    """
+    rnd = random.Random(config.seed)
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    with Session(engine) as db:
+        clear(db)
+
+        operators = [
+            {
+                "id": operator_id,
+                "name": f"Operator {operator_id}",
+                "is_active": rnd.random() < 0.95,
+                "max_load": rnd.randint(10, 50),
+            }
+            for operator_id in range(1, config.operators + 1)
+        ]
+        _insert(db, models.Operator, operators)
+        log(f"operators: {len(operators)}")
+
+        sources = [
+            {"id": source_id, "name": f"Source {source_id}", "description": None}
+            for source_id in range(1, config.sources + 1)
+        ]
+        _insert(db, models.Source, sources)
+        log(f"sources: {len(sources)}")
+
+        per_source = min(config.operators_per_source, config.operators)
+        weights = [
+            {"source_id": source["id"], "operator_id": operator_id, "weight": rnd.randint(1, 100)}
+            for source in sources
+            for operator_id in rnd.sample(range(1, config.operators + 1), per_source)
+        ]
+        _insert(db, models.OperatorSourceWeight, weights)
+        log(f"weights: {len(weights)}")
+
+        lead_step = timedelta(days=config.days) / max(config.leads, 1)
+        lead_start = now - timedelta(days=config.days)
+        leads = (
+            {
+                "id": lead_id,
+                "external_id": f"lead-{lead_id}",
+                "name": f"Lead {lead_id}",
+                "email": f"lead{lead_id}@example.com",
+                "phone": f"+7{9000000000 + lead_id}",
+                "created_at": lead_start + lead_step * lead_id,
+            }
+            for lead_id in range(1, config.leads + 1)
+        )
+        lead_count = _insert(db, models.Lead, leads)
+        log(f"leads: {lead_count}")
+
+        active_operators = {operator["id"] for operator in operators if operator["is_active"]}
+        max_load = {operator["id"]: operator["max_load"] for operator in operators}
+        samplers = {}
+        for weight in weights:
+            if weight["operator_id"] in active_operators:
+                samplers.setdefault(weight["source_id"], []).append(
+                    (weight["operator_id"], weight["weight"])
+                )
+        samplers = {source_id: AliasSampler(pairs) for source_id, pairs in samplers.items()}
+        empty = AliasSampler([])
+        capacity = dict(max_load)
+        available = {operator_id for operator_id in active_operators if capacity[operator_id] > 0}
+
+        first_active = config.appeals - int(config.appeals * config.active_ratio)
+        appeal_step = timedelta(days=config.days) / max(config.appeals, 1)
+
+        # random() scaled to a range is several times cheaper than randint() per row
+        uniform = rnd.random
+
+        def appeals():
+            for appeal_id in range(1, config.appeals + 1):
+                source_id = 1 + int(uniform() * config.sources)
+                sampler = samplers.get(source_id, empty)
+                created_at = lead_start + appeal_step * appeal_id
+                is_active = appeal_id > first_active
+                if is_active:
+                    operator_id = sampler.sample(available)
+                    if operator_id is not None:
+                        capacity[operator_id] -= 1
+                        if not capacity[operator_id]:
+                            available.discard(operator_id)
+                else:
+                    operator_id = sampler.sample()
+                yield {
+                    "id": appeal_id,
+                    "lead_id": 1 + int(uniform() * config.leads),
+                    "source_id": source_id,
+                    "operator_id": operator_id,
+                    "message": None,
+                    "is_active": is_active,
+                    "created_at": created_at,
+                    "closed_at": (
+                        None if is_active else created_at + timedelta(minutes=1 + 600 * uniform())
+                    ),
+                }
+
+        # Secondary indexes are built once after the load instead of row by row
+        connection = db.connection()
+        for index in models.Appeal.__table__.indexes:
+            index.drop(connection, checkfirst=True)
+        try:
+            appeal_count = _insert(db, models.Appeal, appeals())
+        finally:
+            for index in models.Appeal.__table__.indexes:
+                index.create(connection, checkfirst=True)
+        log(f"appeals: {appeal_count}")
+
+        _reset_sequences(db, (models.Operator, models.Source, models.Lead, models.Appeal))
+        counters, rollups = AppealCounterService.rebuild(db)
+        AppealAssignmentService.recount_operator_loads(db)
+        routing_cache.bump_version(db)
+        db.commit()
+    routing_cache.invalidate()
+
+    return {
+        **asdict(config),
+        "weights": len(weights),
+        "appeal_counters": counters,
+        "appeal_rollups": rollups,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def count_rows(engine: Engine) -> dict:
+    """Row counts of the main tables."""
+    tables = {
+        "operators": models.Operator,
+        "sources": models.Source,
+        "leads": models.Lead,
+        "appeals": models.Appeal,
+    }
+    with Session(engine) as db:
+        return {
+            name: db.scalar(select(func.count()).select_from(model))
+            for name, model in tables.items()
+        }
@@ -2,15 +2,20 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.config import settings
 from src.database import init_db
-from src.routers import appeals, leads, operators, sources, statistics
+from src.middleware import SQLProfilingMiddleware
+from src.routers import appeals, debug, leads, operators, sources, statistics
+from src.services import appeal_dispatcher, sql_profiler
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     init_db()
+    appeal_dispatcher.start()
     yield
+    await appeal_dispatcher.stop()
 
 
 app = FastAPI(
@@ -25,3 +30,8 @@ app.include_router(sources)
 app.include_router(appeals)
 app.include_router(leads)
 app.include_router(statistics)
+
+if settings.sql_profiling:
+    sql_profiler.install()
+    app.add_middleware(SQLProfilingMiddleware, profiler=sql_profiler)
+    app.include_router(debug)
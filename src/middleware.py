@@ -0,0 +1,46 @@
+"""ASGI middleware."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.services.profiling import RequestProfile, SQLProfiler, current_profile
+
+
+class SQLProfilingMiddleware:
+    """
+    Profiles SQL statements of every HTTP request: adds a `Server-Timing` header
+    (statements and database time until the response starts) and records the
+    whole request, streamed body included, in the profiler under its route template.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: SQLProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # In-process clients (benchmarks) may already profile the request: share it
+        profile = current_profile.get() or RequestProfile()
+        token = current_profile.set(profile)
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", profile.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_profile.reset(token)
+            # Route is set in scope by the router; unmatched paths share one entry
+            route = scope.get("route")
+            path = getattr(route, "path", "<unmatched>")
+            self.profiler.record(
+                f"{scope['method']} {path}", profile, time.perf_counter() - started
+            )
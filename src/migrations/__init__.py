@@ -0,0 +1,78 @@
+"""
+Versioned schema migrations.
+
+Fresh databases are created from the models and stamped with the latest version;
+existing databases are upgraded by applying pending migrations in order.
+Migrations must be idempotent: databases created by `create_all` before versioning
+was introduced may already contain some of their changes.
+"""
+
+import logging
+
+from sqlalchemy import Connection, Engine, inspect, select, text
+
+from src.migrations.versions import MIGRATIONS, Migration
+from src.models import Base, SchemaVersion
+
+logger = logging.getLogger(__name__)
+
+HEAD = MIGRATIONS[-1].version
+
+
+def get_version(conn: Connection) -> int | None:
+    """Schema version of database, None if it is not versioned yet."""
+    if not inspect(conn).has_table(SchemaVersion.__tablename__):
+        return None
+    return conn.execute(select(SchemaVersion.version)).scalar() or 0
+
+
+def _set_version(conn: Connection, version: int) -> None:
+    conn.execute(SchemaVersion.__table__.delete())
+    conn.execute(SchemaVersion.__table__.insert().values(version=version))
+
+
+def _lock(conn: Connection) -> None:
+    """Serialize concurrent upgrades (several workers starting at once)."""
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('crm_leads_migrations'))"))
+
+
+def pending(version: int | None) -> list[Migration]:
+    """Migrations not applied to database of given version yet."""
+    return [migration for migration in MIGRATIONS if migration.version > (version or 0)]
+
+
+def check(engine: Engine) -> None:
+    """Raise when database schema is not at HEAD (startup without auto-migration)."""
+    with engine.connect() as conn:
+        version = get_version(conn)
+    if version != HEAD:
+        raise RuntimeError(
+            f"Database schema version is {version}, expected {HEAD}: "
+            "run `python -m src.cli migrate`"
+        )
+
+
+def upgrade(engine: Engine, log=logger.info) -> int:
+    """Bring database schema to HEAD. Returns number of applied migrations."""
+    with engine.begin() as conn:
+        _lock(conn)
+        version = get_version(conn)
+
+        if version is None and not inspect(conn).get_table_names():
+            # Empty database: create current schema directly
+            Base.metadata.create_all(conn)
+            _set_version(conn, HEAD)
+            log(f"Created schema version {HEAD}")
+            return 0
+
+        if version is None:
+            SchemaVersion.__table__.create(conn)
+
+        applied = 0
+        for migration in pending(version):
+            log(f"Applying migration {migration.version}: {migration.description}")
+            migration.upgrade(conn)
+            _set_version(conn, migration.version)
+            applied += 1
+        return applied
@@ -0,0 +1,175 @@
+"""
+Migrations in order of versions; append new ones at the end.
+
+Migrations use explicit SQL and snapshots of the tables they create rather than
+models and services: a migration must do the same thing on every database it
+meets, whatever the current code looks like.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Connection,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    inspect,
+    text,
+)
+
+# Tables as the migrations below create them, independent of later changes of the models
+snapshot = MetaData()
+
+# Tables of the initial schema, only as targets of foreign keys (never created here)
+Table("leads", snapshot, Column("id", Integer, primary_key=True))
+Table("sources", snapshot, Column("id", Integer, primary_key=True))
+Table("operators", snapshot, Column("id", Integer, primary_key=True))
+
+routing_version_v1 = Table(
+    "routing_version",
+    snapshot,
+    Column("id", Integer, primary_key=True),
+    Column("version", Integer, nullable=False),
+)
+appeal_counters_v1 = Table(
+    "appeal_counters",
+    snapshot,
+    Column("source_id", ForeignKey("sources.id"), primary_key=True),
+    Column("operator_id", Integer, primary_key=True),
+    Column("total", Integer, nullable=False),
+    Column("active", Integer, nullable=False),
+)
+appeal_rollups_v1 = Table(
+    "appeal_rollups",
+    snapshot,
+    Column("bucket_start", DateTime, primary_key=True),
+    Column("source_id", ForeignKey("sources.id"), primary_key=True),
+    Column("operator_id", Integer, primary_key=True),
+    Column("appeals", Integer, nullable=False),
+)
+appeals_archive_v5 = Table(
+    "appeals_archive",
+    snapshot,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("lead_id", ForeignKey("leads.id"), nullable=False),
+    Column("source_id", ForeignKey("sources.id"), nullable=False),
+    Column("operator_id", ForeignKey("operators.id")),
+    Column("message", String),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("closed_at", DateTime),
+    Column("archived_at", DateTime, nullable=False, server_default=func.now()),
+    Index("ix_appeals_archive_lead_id", "lead_id"),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def create_missing_tables(conn: Connection) -> None:
+    """Tables added after the initial schema (created together with their indexes)."""
+    snapshot.create_all(conn, tables=[routing_version_v1, appeal_counters_v1, appeal_rollups_v1])
+
+
+# Composite indexes of hot queries on tables of the initial schema, as (name, table, columns)
+PERFORMANCE_INDEXES = [
+    # Operator load, FIFO backlog of unassigned appeals
+    (
+        "ix_appeals_operator_id_is_active_created_at",
+        "appeals",
+        "operator_id, is_active, created_at",
+    ),
+    # Keyset pagination of listings
+    ("ix_appeals_created_at_id", "appeals", "created_at, id"),
+    ("ix_appeals_source_id_created_at_id", "appeals", "source_id, created_at, id"),
+    # Appeals of lead
+    ("ix_appeals_lead_id", "appeals", "lead_id"),
+    ("ix_leads_created_at_id", "leads", "created_at, id"),
+    (
+        "ix_operator_source_weights_source_id_operator_id",
+        "operator_source_weights",
+        "source_id, operator_id",
+    ),
+]
+
+
+def create_performance_indexes(conn: Connection) -> None:
+    """Composite indexes of hot queries on tables of the initial schema."""
+    for name, table, columns in PERFORMANCE_INDEXES:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def build_appeal_counters(conn: Connection) -> None:
+    """Fill statistics counters and rollups from existing appeals."""
+    # Hour of created_at; on SQLite in the text format of datetimes bound from Python
+    if conn.dialect.name == "postgresql":
+        bucket_start = "date_trunc('hour', created_at)"
+    else:
+        bucket_start = "strftime('%Y-%m-%d %H:00:00.000000', created_at)"
+    # Unassigned appeals are counted under operator 0
+    operator_id = "COALESCE(operator_id, 0)"
+
+    conn.execute(text("DELETE FROM appeal_counters"))
+    conn.execute(
+        text(
+            "INSERT INTO appeal_counters (source_id, operator_id, total, active) "
+            f"SELECT source_id, {operator_id}, COUNT(*), "
+            "SUM(CASE WHEN is_active THEN 1 ELSE 0 END) "
+            f"FROM appeals GROUP BY source_id, {operator_id}"
+        )
+    )
+    conn.execute(text("DELETE FROM appeal_rollups"))
+    conn.execute(
+        text(
+            "INSERT INTO appeal_rollups (bucket_start, source_id, operator_id, appeals) "
+            f"SELECT {bucket_start}, source_id, {operator_id}, COUNT(*) "
+            f"FROM appeals GROUP BY {bucket_start}, source_id, {operator_id}"
+        )
+    )
+
+
+def add_operator_active_load(conn: Connection) -> None:
+    """Column of reserved operator load, filled from active appeals."""
+    columns = {column["name"] for column in inspect(conn).get_columns("operators")}
+    if "active_load" not in columns:
+        conn.execute(
+            text("ALTER TABLE operators ADD COLUMN active_load INTEGER NOT NULL DEFAULT 0")
+        )
+    conn.execute(
+        text(
+            "UPDATE operators SET active_load = (SELECT COUNT(*) FROM appeals "
+            "WHERE appeals.operator_id = operators.id AND appeals.is_active)"
+        )
+    )
+
+
+def create_appeals_archive(conn: Connection) -> None:
+    """Archive table of closed appeals and index of archiving candidates."""
+    snapshot.create_all(conn, tables=[appeals_archive_v5])
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_appeals_is_active_closed_at "
+            "ON appeals (is_active, closed_at)"
+        )
+    )
+
+
+MIGRATIONS = [
+    Migration(1, "create routing version, counter and rollup tables", create_missing_tables),
+    Migration(2, "create composite indexes of hot queries", create_performance_indexes),
+    Migration(3, "build appeal counters and rollups", build_appeal_counters),
+    Migration(4, "add operators.active_load", add_operator_active_load),
+    Migration(5, "create appeals archive", create_appeals_archive),
+]
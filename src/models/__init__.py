@@ -1,7 +1,12 @@
 from src.models.appeal import Appeal
+from src.models.archive import AppealArchive
 from src.models.base import Base
+from src.models.counter import UNASSIGNED_OPERATOR_ID, AppealCounter
 from src.models.lead import Lead
 from src.models.operator import Operator
+from src.models.rollup import AppealRollup
+from src.models.routing import RoutingVersion
+from src.models.schema import SchemaVersion
 from src.models.source import Source
 from src.models.weight import OperatorSourceWeight
 
@@ -12,4 +17,10 @@ __all__ = [
     "Source",
     "OperatorSourceWeight",
     "Appeal",
+    "AppealArchive",
+    "RoutingVersion",
+    "AppealCounter",
+    "AppealRollup",
+    "SchemaVersion",
+    "UNASSIGNED_OPERATOR_ID",
 ]
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, String, func
+from sqlalchemy import ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -18,6 +18,19 @@ class Appeal(Base):
     """Specific appeal from lead via source, assigned to operator."""
 
     __tablename__ = "appeals"
+    __table_args__ = (
+        # Operator load and FIFO backlog of unassigned (operator_id IS NULL) appeals
+        Index(
+            "ix_appeals_operator_id_is_active_created_at", "operator_id", "is_active", "created_at"
+        ),
+        # Keyset pagination of listings on (created_at, id)
+        Index("ix_appeals_created_at_id", "created_at", "id"),
+        Index("ix_appeals_source_id_created_at_id", "source_id", "created_at", "id"),
+        # Appeals of lead
+        Index("ix_appeals_lead_id", "lead_id"),
+        # Closed appeals due for archiving
+        Index("ix_appeals_is_active_closed_at", "is_active", "closed_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     lead_id: Mapped[int] = mapped_column(ForeignKey("leads.id"))
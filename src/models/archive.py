@@ -0,0 +1,28 @@
+"""Archived appeal model - closed appeals moved out of the hot table."""
+
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class AppealArchive(Base):
+    """Closed appeal moved from `appeals` by the retention job (same columns and ids)."""
+
+    __tablename__ = "appeals_archive"
+    __table_args__ = (
+        # Appeals of lead
+        Index("ix_appeals_archive_lead_id", "lead_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    lead_id: Mapped[int] = mapped_column(ForeignKey("leads.id"))
+    source_id: Mapped[int] = mapped_column(ForeignKey("sources.id"))
+    operator_id: Mapped[int | None] = mapped_column(ForeignKey("operators.id"))
+    message: Mapped[str | None] = mapped_column(String)
+    is_active: Mapped[bool] = mapped_column(default=False)
+    created_at: Mapped[datetime]
+    closed_at: Mapped[datetime | None]
+    archived_at: Mapped[datetime] = mapped_column(server_default=func.now())
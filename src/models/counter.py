@@ -0,0 +1,18 @@
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+# operator_id of counters of unassigned appeals (primary key columns cannot be NULL)
+UNASSIGNED_OPERATOR_ID = 0
+
+
+class AppealCounter(Base):
+    """Appeal counts per (source, operator), maintained together with appeal writes."""
+
+    __tablename__ = "appeal_counters"
+
+    source_id: Mapped[int] = mapped_column(ForeignKey("sources.id"), primary_key=True)
+    operator_id: Mapped[int] = mapped_column(primary_key=True)
+    total: Mapped[int] = mapped_column(default=0)
+    active: Mapped[int] = mapped_column(default=0)
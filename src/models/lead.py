@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, func
+from sqlalchemy import Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -14,6 +14,8 @@ class Lead(Base):
     """End client who can contact from multiple sources."""
 
     __tablename__ = "leads"
+    # Keyset pagination of listing on (created_at, id)
+    __table_args__ = (Index("ix_leads_created_at_id", "created_at", "id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     external_id: Mapped[str] = mapped_column(String, unique=True, index=True)
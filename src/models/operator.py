@@ -19,6 +19,8 @@ class Operator(Base):
     name: Mapped[str] = mapped_column(String)
     is_active: Mapped[bool] = mapped_column(default=True)
     max_load: Mapped[int] = mapped_column(default=10)
+    # Active appeals assigned to operator, reserved atomically (see AppealAssignmentService)
+    active_load: Mapped[int] = mapped_column(default=0, server_default="0")
 
     source_weights: Mapped[list["OperatorSourceWeight"]] = relationship(
         "OperatorSourceWeight", back_populates="operator", cascade="all, delete-orphan"
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class AppealRollup(Base):
+    """Appeals created per hour, source and operator (0 for unassigned)."""
+
+    __tablename__ = "appeal_rollups"
+
+    # Start of the hour (UTC, same clock as appeals.created_at)
+    bucket_start: Mapped[datetime] = mapped_column(primary_key=True)
+    source_id: Mapped[int] = mapped_column(ForeignKey("sources.id"), primary_key=True)
+    operator_id: Mapped[int] = mapped_column(primary_key=True)
+    appeals: Mapped[int] = mapped_column(default=0)
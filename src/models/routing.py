@@ -0,0 +1,12 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class RoutingVersion(Base):
+    """Version of routing configuration (sources, weights, operators); single row."""
+
+    __tablename__ = "routing_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(default=0)
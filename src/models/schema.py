@@ -0,0 +1,11 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class SchemaVersion(Base):
+    """Applied schema migration version (see src.migrations); single row."""
+
+    __tablename__ = "schema_version"
+
+    version: Mapped[int] = mapped_column(primary_key=True)
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -14,6 +14,9 @@ class OperatorSourceWeight(Base):
     """Weight (competency) of operator for specific source."""
 
     __tablename__ = "operator_source_weights"
+    __table_args__ = (
+        Index("ix_operator_source_weights_source_id_operator_id", "source_id", "operator_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     operator_id: Mapped[int] = mapped_column(ForeignKey("operators.id"))
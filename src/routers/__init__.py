@@ -1,4 +1,5 @@
 from src.routers.appeals import router as appeals
+from src.routers.debug import router as debug
 from src.routers.leads import router as leads
 from src.routers.operators import router as operators
 from src.routers.sources import router as sources
@@ -10,4 +11,5 @@ __all__ = [
     "appeals",
     "leads",
     "statistics",
+    "debug",
 ]
@@ -1,18 +1,26 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from src import models, schemas, services
-from src.database import get_db
+from src.config import settings
+from src.database import DbSession, get_read_session, get_session
+from src.routers.pagination import PageParams, get_page_params
 
 router = APIRouter(prefix="/appeals", tags=["appeals"])
 
 
 @router.post(
-    "", response_model=schemas.AppealResponse, summary="Создать новое обращение", status_code=201
+    "",
+    response_model=schemas.AppealResponse,
+    summary="Создать новое обращение",
+    status_code=201,
+    responses={202: {"description": "Appeal accepted, operator will be assigned asynchronously"}},
 )
-def create_appeal(appeal: schemas.AppealCreate, db: Session = Depends(get_db)):
+async def create_appeal(
+    appeal: schemas.AppealCreate, response: Response, db: DbSession = Depends(get_session)
+):
     """
     Register a new appeal from a lead.
 
@@ -22,63 +30,157 @@ def create_appeal(appeal: schemas.AppealCreate, db: Session = Depends(get_db)):
     - Creates appeal record
 
     If no operators are available, creates appeal without assigned operator.
+
+    In deferred intake mode the appeal is persisted without operator and 202 is
+    returned at once; assignment status is available at `/appeals/{id}/status`.
     """
-    source = services.SourceService.get_source(db, appeal.source_id)
-    if not source:
-        raise HTTPException(status_code=404, detail="Source not found")
+    if settings.appeal_intake_mode == "deferred":
+        return await accept_appeal(appeal, response, db)
 
     # Create appeal with automatic operator assignment
-    db_appeal = services.AppealAssignmentService.create_appeal(db, appeal)
-
-    return schemas.AppealResponse(
-        id=db_appeal.id,
-        lead_id=db_appeal.lead_id,
-        source_id=db_appeal.source_id,
-        operator_id=db_appeal.operator_id,
-        message=db_appeal.message,
-        is_active=db_appeal.is_active,
-        created_at=db_appeal.created_at,
-        operator_name=db_appeal.operator.name if db_appeal.operator else None,
-        lead_external_id=db_appeal.lead.external_id,
-        source_name=db_appeal.source.name,
-    )
+    created = await services.AsyncAppealAssignmentService.create_appeal(db, appeal)
+    if not created:
+        raise HTTPException(status_code=404, detail="Source not found")
+    return created
+
+
+async def accept_appeal(
+    appeal: schemas.AppealCreate, response: Response, db: DbSession
+) -> schemas.AppealResponse:
+    """Persist appeal and queue it for the dispatcher (backpressure when queue is full)."""
+    if not services.appeal_dispatcher.reserve():
+        raise HTTPException(
+            status_code=503,
+            detail="Too many appeals waiting for assignment",
+            headers={"Retry-After": "1"},
+        )
+
+    try:
+        accepted = await services.AsyncAppealAssignmentService.accept_appeal(db, appeal)
+    except Exception:
+        services.appeal_dispatcher.release()
+        raise
+
+    if not accepted:
+        services.appeal_dispatcher.release()
+        raise HTTPException(status_code=404, detail="Source not found")
+
+    services.appeal_dispatcher.submit(accepted.id)
+    response.status_code = 202
+    response.headers["Location"] = f"/appeals/{accepted.id}/status"
+    return accepted
+
+
+MAX_BATCH_SIZE = 1000
+
+
+@router.post(
+    "/batch",
+    response_model=list[schemas.AppealBatchResult],
+    summary="Создать пакет обращений",
+)
+async def create_appeals_batch(
+    appeals: list[schemas.AppealCreate], db: DbSession = Depends(get_session)
+):
+    """
+    Register a batch of appeals in a single transaction.
+
+    Leads are resolved in bulk, every appeal is routed against one load snapshot
+    (max_load is respected across the whole batch) and all appeals are inserted
+    with a single commit. Returns per-item results in request order; items with
+    an unknown source are reported with an error and are not created.
+    """
+    if len(appeals) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413, detail=f"Batch size exceeds limit of {MAX_BATCH_SIZE} appeals"
+        )
+
+    return await services.AsyncAppealAssignmentService.create_appeals_batch(db, appeals)
 
 
 @router.get(
     "",
-    response_model=list[schemas.AppealResponse],
+    response_model=schemas.Page[schemas.AppealResponse],
     summary="Получить список обращений",
 )
-def get_appeals(
+async def get_appeals(
     source_id: int | None = None,
     operator_id: int | None = None,
     is_active: bool | None = None,
-    db: Session = Depends(get_db),
+    page: PageParams = Depends(get_page_params),
+    db: DbSession = Depends(get_read_session),
 ):
-    """Get list of appeals with optional filters."""
-    query = db.query(models.Appeal)
-
-    if source_id is not None:
-        query = query.filter(models.Appeal.source_id == source_id)
-    if operator_id is not None:
-        query = query.filter(models.Appeal.operator_id == operator_id)
-    if is_active is not None:
-        query = query.filter(models.Appeal.is_active == is_active)
-
-    appeals = query.all()
-
-    return [
-        schemas.AppealResponse(
-            id=a.id,
-            lead_id=a.lead_id,
-            source_id=a.source_id,
-            operator_id=a.operator_id,
-            message=a.message,
-            is_active=a.is_active,
-            created_at=a.created_at,
-            operator_name=a.operator.name if a.operator else None,
-            lead_external_id=a.lead.external_id,
-            source_name=a.source.name,
-        )
-        for a in appeals
-    ]
+    """
+    Get page of appeals with optional filters, oldest first.
+    Pass `next_cursor` of the response as `cursor` to get the next page.
+    """
+    return await services.AsyncAppealService.get_appeals(
+        db,
+        source_id=source_id,
+        operator_id=operator_id,
+        is_active=is_active,
+        after=page.after,
+        limit=page.limit,
+    )
+
+
+@router.get(
+    "/export",
+    summary="Выгрузка обращений (NDJSON/CSV)",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+async def export_appeals(
+    source_id: int | None = None,
+    operator_id: int | None = None,
+    is_active: bool | None = None,
+    export_format: services.ExportFormat = Query("ndjson", alias="format"),
+):
+    """
+    Stream all appeals matching filters as NDJSON (one object per line) or CSV,
+    ordered by id. Rows are read with a server-side cursor and sent in chunks.
+    """
+    query = services.AppealService.filtered_query(source_id, operator_id, is_active).order_by(
+        models.Appeal.id
+    )
+    return StreamingResponse(
+        services.stream_export(query, export_format),
+        media_type=services.EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="appeals.{export_format}"'},
+    )
+
+
+@router.get(
+    "/{appeal_id}/status",
+    response_model=schemas.AppealStatusResponse,
+    summary="Статус назначения оператора на обращение",
+)
+async def get_appeal_status(appeal_id: int, db: DbSession = Depends(get_session)):
+    """
+    Get assignment status of appeal: pending, assigned or closed.
+    Read from the primary database: clients poll it right after a deferred 202,
+    and a lagging replica would not know the appeal yet.
+    """
+    status = await services.AsyncAppealService.get_appeal_status(db, appeal_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="Appeal not found")
+    return status
+
+
+@router.post(
+    "/{appeal_id}/close",
+    response_model=schemas.AppealResponse,
+    summary="Закрыть обращение",
+)
+async def close_appeal(appeal_id: int, db: DbSession = Depends(get_session)):
+    """
+    Close appeal: sets closed_at and is_active=False.
+    Freed operator capacity is used to assign the oldest unassigned appeals.
+    """
+    appeal = await services.AsyncAppealService.close_appeal(db, appeal_id)
+    if not appeal:
+        raise HTTPException(status_code=404, detail="Appeal not found")
+
+    if appeal.operator_id is not None:
+        services.appeal_dispatcher.notify_capacity(appeal.operator_id)
+    return appeal
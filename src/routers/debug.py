@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Query
+
+from src import schemas, services
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/profile", response_model=list[schemas.RouteProfile])
+async def get_profile(limit: int = Query(50, ge=1, le=1000)):
+    """
+    Routes ranked by total database time over the last requests
+    (window of `SQL_PROFILING_WINDOW` requests).
+    """
+    return services.sql_profiler.summary()[:limit]
+
+
+@router.delete("/profile", status_code=204)
+async def clear_profile():
+    """Drop recorded profiles (e.g. before measuring a change)."""
+    services.sql_profiler.clear()
@@ -1,22 +1,27 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 
-from src import models, schemas
-from src.database import get_db
+from src import schemas, services
+from src.database import DbSession, get_read_session
+from src.routers.pagination import PageParams, get_page_params
 
 router = APIRouter(prefix="/leads", tags=["leads"])
 
 
 @router.get(
     "",
-    response_model=list[schemas.LeadResponse],
+    response_model=schemas.Page[schemas.LeadResponse],
     summary="Просмотр списка лидов",
 )
-def get_leads(db: Session = Depends(get_db)):
-    """Get list of all leads."""
-    return db.query(models.Lead).all()
+async def get_leads(
+    page: PageParams = Depends(get_page_params), db: DbSession = Depends(get_read_session)
+):
+    """
+    Get page of leads, oldest first.
+    Pass `next_cursor` of the response as `cursor` to get the next page.
+    """
+    return await services.AsyncLeadService.get_leads(db, after=page.after, limit=page.limit)
 
 
 @router.get(
@@ -24,9 +29,9 @@ def get_leads(db: Session = Depends(get_db)):
     response_model=schemas.LeadResponse,
     summary="Просмотр лида по ID",
 )
-def get_lead(lead_id: int, db: Session = Depends(get_db)):
+async def get_lead(lead_id: int, db: DbSession = Depends(get_read_session)):
     """Get specific lead by ID."""
-    lead = db.query(models.Lead).filter(models.Lead.id == lead_id).first()
+    lead = await services.AsyncLeadService.get_lead(db, lead_id)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
     return lead
@@ -37,26 +42,10 @@ def get_lead(lead_id: int, db: Session = Depends(get_db)):
     response_model=list[schemas.AppealResponse],
     summary="Просмотр обращений по ID лида",
 )
-def get_lead_appeals(lead_id: int, db: Session = Depends(get_db)):
+async def get_lead_appeals(lead_id: int, db: DbSession = Depends(get_read_session)):
     """Get all appeals for a specific lead (showing appeals from different sources)."""
-    lead = db.query(models.Lead).filter(models.Lead.id == lead_id).first()
+    lead = await services.AsyncLeadService.get_lead(db, lead_id)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
 
-    appeals = db.query(models.Appeal).filter(models.Appeal.lead_id == lead_id).all()
-
-    return [
-        schemas.AppealResponse(
-            id=a.id,
-            lead_id=a.lead_id,
-            source_id=a.source_id,
-            operator_id=a.operator_id,
-            message=a.message,
-            is_active=a.is_active,
-            created_at=a.created_at,
-            operator_name=a.operator.name if a.operator else None,
-            lead_external_id=a.lead.external_id,
-            source_name=a.source.name,
-        )
-        for a in appeals
-    ]
+    return await services.AsyncLeadService.get_lead_appeals(db, lead_id)
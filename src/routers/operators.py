@@ -1,10 +1,9 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 
 from src import schemas, services
-from src.database import get_db
+from src.database import DbSession, get_read_session, get_session
 
 router = APIRouter(prefix="/operators", tags=["operators"])
 
@@ -15,17 +14,8 @@ router = APIRouter(prefix="/operators", tags=["operators"])
     summary="Создать нового операторов",
     status_code=201,
 )
-def create_operator(operator: schemas.OperatorCreate, db: Session = Depends(get_db)):
-    db_operator = services.OperatorService.create_operator(db, operator)
-    current_load = services.AppealAssignmentService.get_operator_current_load(db, db_operator.id)
-
-    return schemas.OperatorResponse(
-        id=db_operator.id,
-        name=db_operator.name,
-        is_active=db_operator.is_active,
-        max_load=db_operator.max_load,
-        current_load=current_load,
-    )
+async def create_operator(operator: schemas.OperatorCreate, db: DbSession = Depends(get_session)):
+    return await services.AsyncOperatorService.create_operator(db, operator)
 
 
 @router.get(
@@ -33,20 +23,9 @@ def create_operator(operator: schemas.OperatorCreate, db: Session = Depends(get_
     response_model=list[schemas.OperatorResponse],
     summary="Просмотр списка операторов",
 )
-def get_operators(db: Session = Depends(get_db)):
+async def get_operators(db: DbSession = Depends(get_read_session)):
     """Get list of all operators with their current load."""
-    operators = services.OperatorService.get_operators(db)
-
-    return [
-        schemas.OperatorResponse(
-            id=op.id,
-            name=op.name,
-            is_active=op.is_active,
-            max_load=op.max_load,
-            current_load=services.AppealAssignmentService.get_operator_current_load(db, op.id),
-        )
-        for op in operators
-    ]
+    return await services.AsyncOperatorService.get_operators(db)
 
 
 @router.get(
@@ -54,21 +33,12 @@ def get_operators(db: Session = Depends(get_db)):
     response_model=schemas.OperatorResponse,
     summary="Просмотр оператора по id",
 )
-def get_operator(operator_id: int, db: Session = Depends(get_db)):
+async def get_operator(operator_id: int, db: DbSession = Depends(get_read_session)):
     """Get specific operator by ID."""
-    operator = services.OperatorService.get_operator(db, operator_id)
+    operator = await services.AsyncOperatorService.get_operator_response(db, operator_id)
     if not operator:
         raise HTTPException(status_code=404, detail="Operator not found")
-
-    current_load = services.AppealAssignmentService.get_operator_current_load(db, operator.id)
-
-    return schemas.OperatorResponse(
-        id=operator.id,
-        name=operator.name,
-        is_active=operator.is_active,
-        max_load=operator.max_load,
-        current_load=current_load,
-    )
+    return operator
 
 
 @router.patch(
@@ -76,20 +46,16 @@ def get_operator(operator_id: int, db: Session = Depends(get_db)):
     response_model=schemas.OperatorResponse,
     summary="Обновление оператора по id",
 )
-def update_operator(
-    operator_id: int, operator_update: schemas.OperatorUpdate, db: Session = Depends(get_db)
+async def update_operator(
+    operator_id: int, operator_update: schemas.OperatorUpdate, db: DbSession = Depends(get_session)
 ):
     """Update operator (activity status, max load, name)."""
-    operator = services.OperatorService.update_operator(db, operator_id, operator_update)
+    operator = await services.AsyncOperatorService.update_operator(db, operator_id, operator_update)
     if not operator:
         raise HTTPException(status_code=404, detail="Operator not found")
 
-    current_load = services.AppealAssignmentService.get_operator_current_load(db, operator.id)
+    # Activation or raised limit may free capacity for unassigned appeals
+    if operator.is_active:
+        services.appeal_dispatcher.notify_capacity(operator.id)
 
-    return schemas.OperatorResponse(
-        id=operator.id,
-        name=operator.name,
-        is_active=operator.is_active,
-        max_load=operator.max_load,
-        current_load=current_load,
-    )
+    return operator
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Query
+
+from src.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Cursor, decode_cursor
+
+
+@dataclass
+class PageParams:
+    after: Cursor | None
+    limit: int
+
+
+def get_page_params(
+    cursor: str | None = Query(None, description="`next_cursor` of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> PageParams:
+    """Dependency for keyset-paginated listings."""
+    if cursor is None:
+        return PageParams(after=None, limit=limit)
+    try:
+        return PageParams(after=decode_cursor(cursor), limit=limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
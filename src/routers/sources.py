@@ -1,10 +1,9 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
 
 from src import schemas, services
-from src.database import get_db
+from src.database import DbSession, get_read_session, get_session
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
@@ -12,17 +11,17 @@ router = APIRouter(prefix="/sources", tags=["sources"])
 @router.post(
     "", response_model=schemas.SourceResponse, summary="Создание нового источника", status_code=201
 )
-def create_source(source: schemas.SourceCreate, db: Session = Depends(get_db)):
+async def create_source(source: schemas.SourceCreate, db: DbSession = Depends(get_session)):
     """Create a new source (bot/channel)."""
-    return services.SourceService.create_source(db, source)
+    return await services.AsyncSourceService.create_source(db, source)
 
 
 @router.get(
     "", response_model=list[schemas.SourceResponse], summary="Просмотр списка всех источников"
 )
-def get_sources(db: Session = Depends(get_db)):
+async def get_sources(db: DbSession = Depends(get_read_session)):
     """Get list of all sources."""
-    return services.SourceService.get_sources(db)
+    return await services.AsyncSourceService.get_sources(db)
 
 
 @router.get(
@@ -30,9 +29,9 @@ def get_sources(db: Session = Depends(get_db)):
     response_model=schemas.SourceResponse,
     summary="Просмотр информации об источнике по ID",
 )
-def get_source(source_id: int, db: Session = Depends(get_db)):
+async def get_source(source_id: int, db: DbSession = Depends(get_read_session)):
     """Get specific source by ID."""
-    source = services.SourceService.get_source(db, source_id)
+    source = await services.AsyncSourceService.get_source(db, source_id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
     return source
@@ -43,8 +42,8 @@ def get_source(source_id: int, db: Session = Depends(get_db)):
     response_model=list[schemas.OperatorSourceWeightResponse],
     summary="Настройка весов операторов для источника",
 )
-def configure_source_weights(
-    source_id: int, weights: list[schemas.WeightConfig], db: Session = Depends(get_db)
+async def configure_source_weights(
+    source_id: int, weights: list[schemas.WeightConfig], db: DbSession = Depends(get_session)
 ):
     """
     Configure operator weights for a source.
@@ -53,19 +52,21 @@ def configure_source_weights(
     Example: [{"operator_id": 1, "weight": 10}, {"operator_id": 2, "weight": 30}]
     This means operator 1 gets 25% and operator 2 gets 75% of traffic.
     """
-    source = services.SourceService.get_source(db, source_id)
+    source = await services.AsyncSourceService.get_source(db, source_id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
     for weight_config in weights:
-        operator = services.OperatorService.get_operator(db, weight_config.operator_id)
+        operator = await services.AsyncOperatorService.get_operator(db, weight_config.operator_id)
         if not operator:
             raise HTTPException(
                 status_code=404, detail=f"Operator {weight_config.operator_id} not found"
             )
 
     config = schemas.SourceWeightConfig(source_id=source_id, weights=weights)
-    db_weights = services.SourceService.configure_source_weights(db, config)
+    db_weights = await services.AsyncSourceService.configure_source_weights(db, config)
+    for weight_config in weights:
+        services.appeal_dispatcher.notify_capacity(weight_config.operator_id)
 
     return [
         schemas.OperatorSourceWeightResponse(
@@ -84,14 +85,14 @@ def configure_source_weights(
     response_model=list[schemas.OperatorSourceWeightResponse],
     summary="Просмотр весов по id источника",
 )
-def get_source_weights(source_id: int, db: Session = Depends(get_db)):
+async def get_source_weights(source_id: int, db: DbSession = Depends(get_read_session)):
     """Get weight configuration for a source."""
 
-    source = services.SourceService.get_source(db, source_id)
+    source = await services.AsyncSourceService.get_source(db, source_id)
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
-    weights = services.SourceService.get_source_weights(db, source_id)
+    weights = await services.AsyncSourceService.get_source_weights(db, source_id)
 
     return [
         schemas.OperatorSourceWeightResponse(
@@ -1,32 +1,125 @@
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Literal
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 
 from src import schemas, services
-from src.database import get_db
+from src.database import DbSession, get_read_session
 
 router = APIRouter(prefix="/statistics", tags=["statistics"])
 
+CACHED_RESPONSES = {304: {"description": "Not modified (matches `If-None-Match`)"}}
+OPERATOR_STATISTICS = TypeAdapter(list[schemas.OperatorStatistics])
+SOURCE_STATISTICS = TypeAdapter(list[schemas.SourceStatistics])
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether `If-None-Match` header of request matches entity tag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+async def cached_json(request: Request, key: str, compute, adapter: TypeAdapter) -> Response:
+    """
+    Serve JSON response from statistics cache with ETag; 304 when client copy is current.
+    A cache hit costs no database queries and no serialization.
+    """
+
+    async def serialize() -> bytes:
+        return adapter.dump_json(await compute())
+
+    entry = await services.statistics_cache.get_or_compute(key, serialize)
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
 
 @router.get(
     "/operators",
     response_model=list[schemas.OperatorStatistics],
     summary="Просмотр статистики загруженности операторов",
+    responses=CACHED_RESPONSES,
 )
-def get_operator_statistics(db: Session = Depends(get_db)):
-    """Get statistics for all operators."""
-    return services.StatisticsService.get_operator_statistics(db)
+async def get_operator_statistics(request: Request, db: DbSession = Depends(get_read_session)):
+    """Get statistics for all operators (cached, supports `If-None-Match`)."""
+    return await cached_json(
+        request,
+        "operators",
+        lambda: services.AsyncStatisticsService.get_operator_statistics(db),
+        OPERATOR_STATISTICS,
+    )
 
 
 @router.get(
     "/sources",
     response_model=list[schemas.SourceStatistics],
     summary="Просмотр статистики источников по процентному соотношению операторов",
+    responses=CACHED_RESPONSES,
 )
-def get_source_statistics(db: Session = Depends(get_db)):
+async def get_source_statistics(request: Request, db: DbSession = Depends(get_read_session)):
     """
     Get statistics for all sources with detailed operator distribution.
     Shows weights, expected vs actual distribution percentages.
+    Cached, supports `If-None-Match`.
     """
-    return services.StatisticsService.get_source_statistics(db)
+    return await cached_json(
+        request,
+        "sources",
+        lambda: services.AsyncStatisticsService.get_source_statistics(db),
+        SOURCE_STATISTICS,
+    )
+
+
+def to_utc(value: datetime) -> datetime:
+    """Naive UTC datetime (clock of appeals.created_at); naive input is taken as UTC."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@router.get(
+    "/sources/timeline",
+    response_model=schemas.SourceTimeline,
+    summary="Статистика источников по часам/дням",
+)
+async def get_source_timeline(
+    start: datetime | None = Query(
+        None, alias="from", description="Default: 24 buckets before `to`"
+    ),
+    end: datetime | None = Query(None, alias="to", description="Exclusive, default: now (UTC)"),
+    granularity: Literal["hour", "day"] = "hour",
+    db: DbSession = Depends(get_read_session),
+):
+    """
+    Source statistics (expected vs actual distribution) per hour or day bucket.
+    Answered from hourly rollups, so cost does not depend on the number of appeals.
+    Sparse: current weights (expected percentages) once per source, then only buckets
+    and (source, operator) cells with appeals.
+    """
+    step = services.StatisticsService.TIMELINE_STEPS[granularity]
+    end = to_utc(end) if end else datetime.now(timezone.utc).replace(tzinfo=None)
+    start = to_utc(start) if start else end - step * 24
+
+    if start >= end:
+        raise HTTPException(status_code=400, detail="`from` must be earlier than `to`")
+    first_bucket = services.StatisticsService.bucket_start(start, granularity)
+    if (end - first_bucket) / step > services.StatisticsService.MAX_TIMELINE_BUCKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range exceeds {services.StatisticsService.MAX_TIMELINE_BUCKETS} buckets",
+        )
+
+    timeline = await services.AsyncStatisticsService.get_source_timeline(
+        db, start, end, granularity
+    )
+    if timeline is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range exceeds {services.StatisticsService.MAX_TIMELINE_CELLS} cells",
+        )
+    return timeline
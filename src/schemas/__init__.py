@@ -1,8 +1,20 @@
-from src.schemas.appeal import AppealCreate, AppealResponse
+from src.schemas.appeal import AppealBatchResult, AppealCreate, AppealResponse, AppealStatusResponse
 from src.schemas.lead import LeadBase, LeadCreate, LeadResponse
 from src.schemas.operator import OperatorBase, OperatorCreate, OperatorResponse, OperatorUpdate
+from src.schemas.pagination import Page
+from src.schemas.profiling import RouteProfile
 from src.schemas.source import SourceBase, SourceCreate, SourceResponse
-from src.schemas.statistics import OperatorAppealDetail, OperatorStatistics, SourceStatistics
+from src.schemas.statistics import (
+    OperatorAppealDetail,
+    OperatorStatistics,
+    SourceStatistics,
+    SourceStatisticsBucket,
+    SourceTimeline,
+    TimelineCell,
+    TimelineOperator,
+    TimelineSource,
+    TimelineSourceBucket,
+)
 from src.schemas.weight import OperatorSourceWeightResponse, SourceWeightConfig, WeightConfig
 
 __all__ = [
@@ -21,7 +33,17 @@ __all__ = [
     "LeadResponse",
     "AppealCreate",
     "AppealResponse",
+    "AppealBatchResult",
+    "AppealStatusResponse",
     "OperatorStatistics",
     "OperatorAppealDetail",
     "SourceStatistics",
+    "SourceStatisticsBucket",
+    "SourceTimeline",
+    "TimelineOperator",
+    "TimelineSource",
+    "TimelineSourceBucket",
+    "TimelineCell",
+    "Page",
+    "RouteProfile",
 ]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 
@@ -28,3 +28,20 @@ class AppealResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class AppealBatchResult(BaseModel):
+    """Result of a single item of a batch appeal request."""
+
+    index: int
+    appeal: AppealResponse | None = None
+    error: str | None = None
+
+
+class AppealStatusResponse(BaseModel):
+    """Assignment status of appeal."""
+
+    id: int
+    status: Literal["pending", "assigned", "closed"]
+    operator_id: int | None = None
+    operator_name: str | None = None
@@ -0,0 +1,13 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Page of a keyset-paginated listing."""
+
+    items: list[T]
+    # Opaque cursor of the next page; None on the last page
+    next_cursor: str | None = None
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class RouteProfile(BaseModel):
+    """SQL profile of a route over the profiling window."""
+
+    route: str
+    requests: int
+    statements: int
+    statements_per_request: float
+    db_time_ms: float
+    db_time_per_request_ms: float
+    request_time_per_request_ms: float
+    slowest_statement_ms: float
+    slowest_statement: str | None
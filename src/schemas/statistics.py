@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List
 
 from pydantic import BaseModel
@@ -29,3 +30,55 @@ class SourceStatistics(BaseModel):
     total_contacts: int
     operators_count: int
     operators: list[OperatorAppealDetail]
+
+
+class TimelineOperator(BaseModel):
+    """Current weight of operator for a source."""
+
+    operator_id: int
+    operator_name: str
+    weight: int
+    expected_percent: float
+
+
+class TimelineSource(BaseModel):
+    id: int
+    name: str
+    operators: list[TimelineOperator]
+
+
+class TimelineCell(BaseModel):
+    """Appeals of a source assigned to operator within a bucket."""
+
+    operator_id: int
+    contacts_count: int
+    actual_percent: float
+
+
+class TimelineSourceBucket(BaseModel):
+    """Appeals of a source within a bucket (unassigned ones count in total only)."""
+
+    source_id: int
+    total_contacts: int
+    operators: list[TimelineCell]
+
+
+class SourceStatisticsBucket(BaseModel):
+    """Sources with appeals created in [start, end)."""
+
+    start: datetime
+    end: datetime
+    sources: list[TimelineSourceBucket]
+
+
+class SourceTimeline(BaseModel):
+    """
+    Sparse timeline: weights are given once per source, buckets and cells
+    only where appeals were created.
+    """
+
+    start: datetime
+    end: datetime
+    granularity: str
+    sources: list[TimelineSource]
+    buckets: list[SourceStatisticsBucket]
@@ -1,13 +1,47 @@
 """Business logic services."""
 
-from src.services.appeal import AppealAssignmentService
+from src.services.aio import (
+    AsyncAppealAssignmentService,
+    AsyncAppealService,
+    AsyncLeadService,
+    AsyncOperatorService,
+    AsyncSourceService,
+    AsyncStatisticsService,
+)
+from src.services.appeal import AppealAssignmentService, AppealService
+from src.services.archive import AppealArchiveService
+from src.services.cache import ResponseCache, statistics_cache
+from src.services.counters import AppealCounterService
+from src.services.dispatcher import AppealDispatcher, appeal_dispatcher
+from src.services.export import EXPORT_MEDIA_TYPES, ExportFormat, stream_export
+from src.services.lead import LeadService
 from src.services.operator import OperatorService
+from src.services.profiling import SQLProfiler, sql_profiler
 from src.services.source import SourceService
 from src.services.statistics import StatisticsService
 
 __all__ = [
+    "AppealService",
     "AppealAssignmentService",
+    "AppealArchiveService",
+    "AppealCounterService",
+    "LeadService",
     "OperatorService",
     "SourceService",
     "StatisticsService",
+    "AsyncAppealService",
+    "AsyncAppealAssignmentService",
+    "AsyncLeadService",
+    "AsyncOperatorService",
+    "AsyncSourceService",
+    "AsyncStatisticsService",
+    "AppealDispatcher",
+    "appeal_dispatcher",
+    "ExportFormat",
+    "EXPORT_MEDIA_TYPES",
+    "stream_export",
+    "ResponseCache",
+    "statistics_cache",
+    "SQLProfiler",
+    "sql_profiler",
 ]
@@ -0,0 +1,54 @@
+"""
+Async versions of the services.
+
+Each method of a sync service taking `db` is exposed as a coroutine accepting
+either session type: with AsyncSession the method runs via `run_sync`
+(greenlet, no thread), with a sync Session it runs in the threadpool.
+"""
+
+import functools
+import inspect
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from src.services.appeal import AppealAssignmentService, AppealService
+from src.services.lead import LeadService
+from src.services.operator import OperatorService
+from src.services.source import SourceService
+from src.services.statistics import StatisticsService
+
+
+def _awaitable(method):
+    """Wrap sync service method `method(db, ...)` into a coroutine."""
+
+    @functools.wraps(method)
+    async def wrapper(db, *args, **kwargs):
+        if isinstance(db, AsyncSession):
+            return await db.run_sync(method, *args, **kwargs)
+        return await run_in_threadpool(method, db, *args, **kwargs)
+
+    return staticmethod(wrapper)
+
+
+def make_async_service(service: type) -> type:
+    """Build async version of a service class (methods without `db` are not exposed)."""
+    methods = {
+        name: _awaitable(attr.__func__)
+        for name, attr in vars(service).items()
+        if isinstance(attr, staticmethod)
+        and next(iter(inspect.signature(attr.__func__).parameters), None) == "db"
+    }
+    return type(
+        f"Async{service.__name__}",
+        (),
+        {"__doc__": f"Async version of {service.__name__}.", **methods},
+    )
+
+
+AsyncAppealService = make_async_service(AppealService)
+AsyncAppealAssignmentService = make_async_service(AppealAssignmentService)
+AsyncLeadService = make_async_service(LeadService)
+AsyncOperatorService = make_async_service(OperatorService)
+AsyncSourceService = make_async_service(SourceService)
+AsyncStatisticsService = make_async_service(StatisticsService)
@@ -1,113 +1,677 @@
 """Appeal assignment service."""
 
-import random
+from collections import Counter, defaultdict
 from typing import List, Optional, Tuple
 
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
 
 from src import models, schemas
+from src.database import dialect_insert
+from src.services.counters import AppealCounterService
+from src.services.pagination import DEFAULT_PAGE_SIZE, Cursor, keyset_page
+from src.services.routing import OperatorInfo, RoutingSnapshot, routing_cache
 
 
-class AppealAssignmentService:
-    """Assigns appeals to operators using weighted distribution."""
+class AppealService:
+    """Service for querying and closing appeals."""
 
     @staticmethod
-    def get_operator_current_load(db: Session, operator_id: int) -> int:
-        """Get current load of operator (count of active appeals)."""
+    def response_query(appeal=models.Appeal):
+        """
+        Select appeal columns with operator, lead and source names joined in,
+        so that listings are built from a single statement (no lazy loads).
+        Reads hot appeals, or archived ones with `appeal=models.AppealArchive`.
+        """
         return (
-            db.query(models.Appeal)
-            .filter(models.Appeal.operator_id == operator_id, models.Appeal.is_active == True)
-            .count()
+            select(
+                appeal.id,
+                appeal.lead_id,
+                appeal.source_id,
+                appeal.operator_id,
+                appeal.message,
+                appeal.is_active,
+                appeal.created_at,
+                models.Operator.name.label("operator_name"),
+                models.Lead.external_id.label("lead_external_id"),
+                models.Source.name.label("source_name"),
+            )
+            .join(models.Lead, appeal.lead_id == models.Lead.id)
+            .join(models.Source, appeal.source_id == models.Source.id)
+            .outerjoin(models.Operator, appeal.operator_id == models.Operator.id)
+        )
+
+    @staticmethod
+    def filtered_query(
+        source_id: int | None = None,
+        operator_id: int | None = None,
+        is_active: bool | None = None,
+    ):
+        """`response_query()` with optional listing filters applied."""
+        query = AppealService.response_query()
+
+        if source_id is not None:
+            query = query.where(models.Appeal.source_id == source_id)
+        if operator_id is not None:
+            query = query.where(models.Appeal.operator_id == operator_id)
+        if is_active is not None:
+            query = query.where(models.Appeal.is_active == is_active)
+
+        return query
+
+    @staticmethod
+    def to_responses(db: Session, query) -> list[schemas.AppealResponse]:
+        """Execute `response_query()`-based query and build API responses."""
+        return [
+            schemas.AppealResponse.model_validate(row._mapping) for row in db.execute(query).all()
+        ]
+
+    @staticmethod
+    def to_page(
+        db: Session, query, after: Cursor | None, limit: int
+    ) -> schemas.Page[schemas.AppealResponse]:
+        """Execute page of `response_query()`-based query in (created_at, id) order."""
+        rows, next_cursor = keyset_page(
+            db, query, models.Appeal.created_at, models.Appeal.id, after, limit
+        )
+        return schemas.Page[schemas.AppealResponse](
+            items=[schemas.AppealResponse.model_validate(row._mapping) for row in rows],
+            next_cursor=next_cursor,
         )
 
     @staticmethod
-    def get_or_create_lead(db: Session, appeal_data: schemas.AppealCreate) -> models.Lead:
-        """Find existing lead by external_id or create new one."""
-        lead = (
-            db.query(models.Lead)
-            .filter(models.Lead.external_id == appeal_data.lead_external_id)
-            .first()
+    def get_appeals(
+        db: Session,
+        source_id: int | None = None,
+        operator_id: int | None = None,
+        is_active: bool | None = None,
+        after: Cursor | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> schemas.Page[schemas.AppealResponse]:
+        """Get page of appeals with optional filters, oldest first."""
+        query = AppealService.filtered_query(source_id, operator_id, is_active)
+        return AppealService.to_page(db, query, after, limit)
+
+    @staticmethod
+    def get_appeal_status(db: Session, appeal_id: int) -> schemas.AppealStatusResponse | None:
+        """Get operator assignment status of appeal (archived appeals are closed)."""
+        for appeal in (models.Appeal, models.AppealArchive):
+            row = db.execute(
+                select(appeal.id, appeal.operator_id, appeal.is_active, models.Operator.name)
+                .outerjoin(models.Operator, appeal.operator_id == models.Operator.id)
+                .where(appeal.id == appeal_id)
+            ).first()
+            if row:
+                break
+        else:
+            return None
+
+        if not row.is_active:
+            status = "closed"
+        elif row.operator_id is None:
+            status = "pending"
+        else:
+            status = "assigned"
+
+        return schemas.AppealStatusResponse(
+            id=row.id, status=status, operator_id=row.operator_id, operator_name=row.name
         )
 
-        if not lead:
-            lead = models.Lead(
-                external_id=appeal_data.lead_external_id,
-                name=appeal_data.lead_name,
-                email=appeal_data.lead_email,
-                phone=appeal_data.lead_phone,
+    @staticmethod
+    def close_appeal(db: Session, appeal_id: int) -> schemas.AppealResponse | None:
+        """Close appeal (frees operator capacity). Closing a closed appeal is a no-op."""
+        closed = db.execute(
+            update(models.Appeal)
+            .where(models.Appeal.id == appeal_id, models.Appeal.is_active == True)
+            .values(is_active=False, closed_at=func.now())
+            .returning(models.Appeal.source_id, models.Appeal.operator_id)
+        ).first()
+        if closed:
+            # Same lock order as assignment: operator, then counters and rollups
+            if closed.operator_id is not None:
+                AppealAssignmentService.release_operator(db, closed.operator_id)
+            AppealCounterService.closed(db, closed.source_id, closed.operator_id)
+        db.commit()
+
+        appeals = AppealService.to_responses(
+            db, AppealService.response_query().where(models.Appeal.id == appeal_id)
+        )
+        if not appeals:
+            # Closed long ago and moved to the archive
+            appeals = AppealService.to_responses(
+                db,
+                AppealService.response_query(models.AppealArchive).where(
+                    models.AppealArchive.id == appeal_id
+                ),
             )
-            db.add(lead)
-            db.commit()
-            db.refresh(lead)
+        return appeals[0] if appeals else None
+
+
+class AppealAssignmentService:
+    """Assigns appeals to operators using weighted distribution."""
 
-        return lead
+    @staticmethod
+    def get_operator_loads(db: Session, operator_ids: set[int]) -> dict[int, int]:
+        """Current load of operators (active appeals, including reservations)."""
+        if not operator_ids:
+            return {}
+        return dict(
+            db.execute(
+                select(models.Operator.id, models.Operator.active_load).where(
+                    models.Operator.id.in_(operator_ids)
+                )
+            ).all()
+        )
 
     @staticmethod
-    def get_available_operators(db: Session, source_id: int) -> list[tuple[models.Operator, int]]:
-        """Get available operators for source with weights (active + not overloaded)."""
-        # Get all operator-weight configs for this source
-        weights = (
-            db.query(models.OperatorSourceWeight)
-            .filter(models.OperatorSourceWeight.source_id == source_id)
-            .all()
+    def reserve_operator(db: Session, operator_id: int, count: int = 1) -> bool:
+        """
+        Atomically take `count` units of operator capacity with a conditional UPDATE,
+        which fails when operator is inactive or would exceed max_load.
+        Only the operator row is locked (until commit), so reservations of
+        different operators do not wait for each other.
+        """
+        reserved = db.execute(
+            update(models.Operator)
+            .where(
+                models.Operator.id == operator_id,
+                models.Operator.is_active == True,
+                models.Operator.active_load + count <= models.Operator.max_load,
+            )
+            .values(active_load=models.Operator.active_load + count)
+            .execution_options(synchronize_session=False)
         )
+        return reserved.rowcount == 1
 
-        available = []
+    @staticmethod
+    def release_operator(db: Session, operator_id: int, count: int = 1) -> None:
+        """Give back `count` units of operator capacity (appeal closed or not assigned)."""
+        db.execute(
+            update(models.Operator)
+            .where(models.Operator.id == operator_id)
+            .values(active_load=models.Operator.active_load - count)
+            .execution_options(synchronize_session=False)
+        )
 
-        for weight_config in weights:
-            operator = weight_config.operator
+    @staticmethod
+    def recount_operator_loads(db: Session) -> int:
+        """Recompute operators' active_load from active appeals. Returns number of operators."""
+        active = (
+            select(func.count(models.Appeal.id))
+            .where(models.Appeal.operator_id == models.Operator.id, models.Appeal.is_active == True)
+            .scalar_subquery()
+        )
+        return db.execute(
+            update(models.Operator)
+            .values(active_load=active)
+            .execution_options(synchronize_session=False)
+        ).rowcount
 
-            if not operator.is_active:
-                continue
+    @staticmethod
+    def lead_upsert(db: Session):
+        """
+        INSERT ... ON CONFLICT(external_id) of leads returning (external_id, id)
+        of the inserted or the existing lead.
+        """
+        stmt = dialect_insert(db, models.Lead)
+        # No-op update of the conflicting row so that RETURNING yields the existing id
+        return stmt.on_conflict_do_update(
+            index_elements=[models.Lead.external_id],
+            set_={"external_id": stmt.excluded.external_id},
+        ).returning(models.Lead.external_id, models.Lead.id)
 
-            # Check current load
-            current_load = AppealAssignmentService.get_operator_current_load(db, operator.id)
-            if current_load >= operator.max_load:
-                continue
+    @staticmethod
+    def upsert_lead(db: Session, appeal_data: schemas.AppealCreate) -> int:
+        """
+        Find existing lead by external_id or create new one, in a single statement.
+        Returns lead id, does not commit.
+        """
+        stmt = AppealAssignmentService.lead_upsert(db).values(
+            external_id=appeal_data.lead_external_id,
+            name=appeal_data.lead_name,
+            email=appeal_data.lead_email,
+            phone=appeal_data.lead_phone,
+        )
+        return db.execute(stmt).one().id
 
-            available.append((operator, weight_config.weight))
+    @staticmethod
+    def get_source_name(db: Session, source_id: int) -> tuple[RoutingSnapshot, str | None]:
+        """
+        Get routing snapshot and name of source (None if source does not exist).
+        An unknown source forces a version check: it may have been created by another worker.
+        """
+        snapshot = routing_cache.get(db)
+        if source_id not in snapshot.sources:
+            snapshot = routing_cache.get(db, refresh=True)
+        return snapshot, snapshot.sources.get(source_id)
 
-        return available
+    @staticmethod
+    def get_available_operators(
+        db: Session, snapshot: RoutingSnapshot, source_id: int
+    ) -> list[tuple[OperatorInfo, int]]:
+        """
+        Get available operators for source with weights (active + not overloaded).
+        Weights and operator flags come from the routing snapshot,
+        current load is fetched with a single grouped query.
+        """
+        candidates = snapshot.candidates(source_id)
+        loads = AppealAssignmentService.get_operator_loads(
+            db, {operator.id for operator, _ in candidates}
+        )
+        return [
+            (operator, weight)
+            for operator, weight in candidates
+            if loads.get(operator.id, 0) < operator.max_load
+        ]
 
     @staticmethod
     def select_operator_by_weight(
-        operators_with_weights: list[tuple[models.Operator, int]]
-    ) -> models.Operator | None:
-        """Select operator using weighted random choice."""
+        snapshot: RoutingSnapshot,
+        source_id: int,
+        operators_with_weights: list[tuple[OperatorInfo, int]],
+    ) -> OperatorInfo | None:
+        """Select operator using the source's precomputed weighted sampler."""
         if not operators_with_weights:
             return None
 
-        operators = [op for op, _ in operators_with_weights]
-        weights = [weight for _, weight in operators_with_weights]
+        available = {op.id: op for op, _ in operators_with_weights}
+        sampler = snapshot.samplers.get(source_id)
+        if sampler is None:
+            return None
+
+        return available.get(sampler.sample(available))
 
-        # Weighted random choice
-        selected = random.choices(operators, weights=weights, k=1)[0]
-        return selected
+    @staticmethod
+    def reserve_by_weight(
+        db: Session, snapshot: RoutingSnapshot, source_id: int
+    ) -> OperatorInfo | None:
+        """
+        Select operator by weight and reserve one unit of its capacity.
+        When the reservation fails (operator filled up concurrently), the operator
+        is masked out and the next one is sampled. Returns None if nobody has capacity.
+        """
+        available = AppealAssignmentService.get_available_operators(db, snapshot, source_id)
+        while available:
+            operator = AppealAssignmentService.select_operator_by_weight(
+                snapshot, source_id, available
+            )
+            if operator is None:
+                return None
+            if AppealAssignmentService.reserve_operator(db, operator.id):
+                return operator
+            available = [(op, weight) for op, weight in available if op.id != operator.id]
+        return None
 
     @staticmethod
-    def create_appeal(db: Session, appeal_data: schemas.AppealCreate) -> models.Appeal:
-        """Create appeal and auto-assign to available operator by weight."""
-        lead = AppealAssignmentService.get_or_create_lead(db, appeal_data)
-        available_operators = AppealAssignmentService.get_available_operators(
-            db, appeal_data.source_id
+    def create_appeal(
+        db: Session, appeal_data: schemas.AppealCreate
+    ) -> schemas.AppealResponse | None:
+        """
+        Create appeal and auto-assign to available operator by weight.
+        Runs as one transaction with a single commit; operator capacity is reserved
+        atomically, so concurrent requests never exceed max_load.
+        Returns None if source does not exist.
+        """
+        snapshot, source_name = AppealAssignmentService.get_source_name(db, appeal_data.source_id)
+        if source_name is None:
+            return None
+
+        lead_id = AppealAssignmentService.upsert_lead(db, appeal_data)
+        selected_operator = AppealAssignmentService.reserve_by_weight(
+            db, snapshot, appeal_data.source_id
         )
 
-        selected_operator = None
-        if available_operators:
-            selected_operator = AppealAssignmentService.select_operator_by_weight(
-                available_operators
+        appeal_id, created_at = db.execute(
+            insert(models.Appeal)
+            .values(
+                lead_id=lead_id,
+                source_id=appeal_data.source_id,
+                operator_id=selected_operator.id if selected_operator else None,
+                message=appeal_data.message,
+                is_active=True,
             )
+            .returning(models.Appeal.id, models.Appeal.created_at)
+        ).one()
 
-        appeal = models.Appeal(
-            lead_id=lead.id,
+        response = schemas.AppealResponse(
+            id=appeal_id,
+            lead_id=lead_id,
             source_id=appeal_data.source_id,
             operator_id=selected_operator.id if selected_operator else None,
             message=appeal_data.message,
             is_active=True,
+            created_at=created_at,
+            operator_name=selected_operator.name if selected_operator else None,
+            lead_external_id=appeal_data.lead_external_id,
+            source_name=source_name,
+        )
+        AppealCounterService.created(db, [(response.source_id, response.operator_id, created_at)])
+        db.commit()
+
+        return response
+
+    @staticmethod
+    def get_or_create_leads(
+        db: Session, appeals_data: list[schemas.AppealCreate]
+    ) -> dict[str, int]:
+        """
+        Resolve lead ids for a batch of appeals by external_id.
+        Existing leads are found with one IN query, new ones are bulk-upserted
+        (ON CONFLICT(external_id)), so a lead created by a concurrent batch is reused.
+        """
+        new_leads = {}
+        for appeal_data in appeals_data:
+            new_leads.setdefault(
+                appeal_data.lead_external_id,
+                {
+                    "external_id": appeal_data.lead_external_id,
+                    "name": appeal_data.lead_name,
+                    "email": appeal_data.lead_email,
+                    "phone": appeal_data.lead_phone,
+                },
+            )
+
+        lead_ids = dict(
+            db.execute(
+                select(models.Lead.external_id, models.Lead.id).where(
+                    models.Lead.external_id.in_(new_leads)
+                )
+            ).all()
+        )
+
+        missing = [lead for external_id, lead in new_leads.items() if external_id not in lead_ids]
+        if missing:
+            stmt = AppealAssignmentService.lead_upsert(db)
+            lead_ids.update(db.execute(stmt, missing).tuples().all())
+
+        return lead_ids
+
+    @staticmethod
+    def get_available_operators_by_source(
+        db: Session, snapshot: RoutingSnapshot, source_ids: set[int]
+    ) -> tuple[dict[int, list[tuple[OperatorInfo, int]]], dict[int, int]]:
+        """
+        Load snapshot for routing a batch: available operators with weights per source
+        and remaining capacity per operator (current load fetched with a single query).
+        """
+        candidates = {source_id: snapshot.candidates(source_id) for source_id in source_ids}
+        operators = {
+            operator.id: operator for weights in candidates.values() for operator, _ in weights
+        }
+        loads = AppealAssignmentService.get_operator_loads(db, set(operators))
+        capacity = {
+            operator_id: operator.max_load - loads.get(operator_id, 0)
+            for operator_id, operator in operators.items()
+        }
+
+        available = defaultdict(list)
+        for source_id, weights in candidates.items():
+            for operator, weight in weights:
+                if capacity[operator.id] > 0:
+                    available[source_id].append((operator, weight))
+
+        return available, capacity
+
+    @staticmethod
+    def route_appeals(db: Session, source_ids: list[int]) -> list[OperatorInfo | None]:
+        """
+        Select operators for a sequence of appeals (given by their source ids)
+        against one load snapshot, and reserve their capacity.
+        Capacity is reserved with one conditional UPDATE per operator (in id order);
+        appeals of an operator that filled up concurrently are rerouted one by one.
+        """
+        snapshot = routing_cache.get(db)
+        candidates, capacity = AppealAssignmentService.get_available_operators_by_source(
+            db, snapshot, set(source_ids)
+        )
+
+        selected_operators = []
+        for source_id in source_ids:
+            available = [
+                (operator, weight)
+                for operator, weight in candidates[source_id]
+                if capacity[operator.id] > 0
+            ]
+            operator = AppealAssignmentService.select_operator_by_weight(
+                snapshot, source_id, available
+            )
+            if operator:
+                capacity[operator.id] -= 1
+            selected_operators.append(operator)
+
+        counts = Counter(operator.id for operator in selected_operators if operator)
+        failed = {
+            operator_id
+            for operator_id in sorted(counts)
+            if not AppealAssignmentService.reserve_operator(db, operator_id, counts[operator_id])
+        }
+        for index, operator in enumerate(selected_operators):
+            if operator and operator.id in failed:
+                selected_operators[index] = AppealAssignmentService.reserve_by_weight(
+                    db, snapshot, source_ids[index]
+                )
+
+        return selected_operators
+
+    @staticmethod
+    def create_appeals_batch(
+        db: Session, appeals_data: list[schemas.AppealCreate]
+    ) -> list[schemas.AppealBatchResult]:
+        """
+        Create a batch of appeals in a single transaction.
+        Every appeal is routed against one load snapshot and operator capacity
+        is reserved, so max_load is respected across the batch and concurrent requests.
+        """
+        source_names = {}
+        for source_id in {a.source_id for a in appeals_data}:
+            _, source_name = AppealAssignmentService.get_source_name(db, source_id)
+            if source_name is not None:
+                source_names[source_id] = source_name
+        accepted = [
+            (index, appeal_data)
+            for index, appeal_data in enumerate(appeals_data)
+            if appeal_data.source_id in source_names
+        ]
+
+        lead_ids = AppealAssignmentService.get_or_create_leads(db, [a for _, a in accepted])
+        selected_operators = AppealAssignmentService.route_appeals(
+            db, [a.source_id for _, a in accepted]
+        )
+
+        rows = []
+        for (_, appeal_data), operator in zip(accepted, selected_operators):
+            rows.append(
+                {
+                    "lead_id": lead_ids[appeal_data.lead_external_id],
+                    "source_id": appeal_data.source_id,
+                    "operator_id": operator.id if operator else None,
+                    "message": appeal_data.message,
+                    "is_active": True,
+                }
+            )
+
+        created = []
+        if rows:
+            created = db.execute(
+                insert(models.Appeal).returning(
+                    models.Appeal.id, models.Appeal.created_at, sort_by_parameter_order=True
+                ),
+                rows,
+            ).all()
+            AppealCounterService.created(
+                db,
+                [
+                    (row["source_id"], row["operator_id"], created_at)
+                    for row, (_, created_at) in zip(rows, created)
+                ],
+            )
+        db.commit()
+
+        results = [
+            schemas.AppealBatchResult(index=index, error="Source not found")
+            for index, appeal_data in enumerate(appeals_data)
+            if appeal_data.source_id not in source_names
+        ]
+        for (index, appeal_data), row, operator, (appeal_id, created_at) in zip(
+            accepted, rows, selected_operators, created
+        ):
+            results.append(
+                schemas.AppealBatchResult(
+                    index=index,
+                    appeal=schemas.AppealResponse(
+                        id=appeal_id,
+                        lead_id=row["lead_id"],
+                        source_id=row["source_id"],
+                        operator_id=row["operator_id"],
+                        message=row["message"],
+                        is_active=True,
+                        created_at=created_at,
+                        operator_name=operator.name if operator else None,
+                        lead_external_id=appeal_data.lead_external_id,
+                        source_name=source_names[row["source_id"]],
+                    ),
+                )
+            )
+
+        return sorted(results, key=lambda result: result.index)
+
+    @staticmethod
+    def accept_appeal(
+        db: Session, appeal_data: schemas.AppealCreate
+    ) -> schemas.AppealResponse | None:
+        """
+        Persist appeal without operator; assignment is done later by the dispatcher.
+        Returns None if source does not exist.
+        """
+        _, source_name = AppealAssignmentService.get_source_name(db, appeal_data.source_id)
+        if source_name is None:
+            return None
+
+        lead_id = AppealAssignmentService.upsert_lead(db, appeal_data)
+        appeal_id, created_at = db.execute(
+            insert(models.Appeal)
+            .values(
+                lead_id=lead_id,
+                source_id=appeal_data.source_id,
+                operator_id=None,
+                message=appeal_data.message,
+                is_active=True,
+            )
+            .returning(models.Appeal.id, models.Appeal.created_at)
+        ).one()
+
+        response = schemas.AppealResponse(
+            id=appeal_id,
+            lead_id=lead_id,
+            source_id=appeal_data.source_id,
+            message=appeal_data.message,
+            is_active=True,
+            created_at=created_at,
+            lead_external_id=appeal_data.lead_external_id,
+            source_name=source_name,
+        )
+        AppealCounterService.created(db, [(response.source_id, None, created_at)])
+        db.commit()
+
+        return response
+
+    @staticmethod
+    def assign_pending(db: Session, pending: list[tuple[int, int]]) -> int:
+        """
+        Route unassigned appeals given as (appeal_id, source_id) rows and commit.
+        Returns number of assigned appeals.
+        """
+        if not pending:
+            return 0
+
+        selected_operators = AppealAssignmentService.route_appeals(
+            db, [source_id for _, source_id in pending]
         )
+        appeal_ids_by_operator = defaultdict(list)
+        for (appeal_id, _), operator in zip(pending, selected_operators):
+            if operator:
+                appeal_ids_by_operator[operator.id].append(appeal_id)
 
-        db.add(appeal)
+        # One conditional UPDATE per operator: appeals closed or assigned meanwhile are
+        # skipped (their reserved capacity is released), and RETURNING tells exactly
+        # which appeals moved between counters
+        assigned = []
+        for operator_id, appeal_ids in appeal_ids_by_operator.items():
+            rows = db.execute(
+                update(models.Appeal)
+                .where(
+                    models.Appeal.id.in_(appeal_ids),
+                    models.Appeal.operator_id.is_(None),
+                    models.Appeal.is_active == True,
+                )
+                .values(operator_id=operator_id)
+                .returning(models.Appeal.source_id, models.Appeal.created_at)
+                .execution_options(synchronize_session=False)
+            ).all()
+            assigned += [(source_id, operator_id, created_at) for source_id, created_at in rows]
+            if len(rows) < len(appeal_ids):
+                AppealAssignmentService.release_operator(
+                    db, operator_id, len(appeal_ids) - len(rows)
+                )
+
+        AppealCounterService.assigned(db, assigned)
         db.commit()
-        db.refresh(appeal)
 
-        return appeal
+        return len(assigned)
+
+    @staticmethod
+    def assign_appeals(db: Session, appeal_ids: list[int]) -> int:
+        """
+        Assign operators to accepted (still unassigned) appeals in one transaction.
+        Returns number of assigned appeals.
+        """
+        pending = db.execute(
+            select(models.Appeal.id, models.Appeal.source_id)
+            .where(
+                models.Appeal.id.in_(appeal_ids),
+                models.Appeal.operator_id.is_(None),
+                models.Appeal.is_active == True,
+            )
+            .order_by(models.Appeal.id)
+        ).all()
+
+        return AppealAssignmentService.assign_pending(db, pending)
+
+    @staticmethod
+    def backfill_unassigned(db: Session, operator_id: int | None, batch_size: int = 100) -> int:
+        """
+        Drain oldest unassigned appeals (FIFO batches) after operator capacity was freed.
+        Only sources of the operator are drained; all sources when operator_id is None.
+        Each batch is taken from sources that still have an operator with free capacity,
+        so appeals of sources nobody can take do not block the others.
+        Returns number of assigned appeals.
+        """
+        query = (
+            select(models.Appeal.id, models.Appeal.source_id)
+            .where(models.Appeal.operator_id.is_(None), models.Appeal.is_active == True)
+            .order_by(models.Appeal.created_at, models.Appeal.id)
+            .limit(batch_size)
+        )
+        if operator_id is not None:
+            query = query.where(
+                models.Appeal.source_id.in_(
+                    select(models.OperatorSourceWeight.source_id).where(
+                        models.OperatorSourceWeight.operator_id == operator_id
+                    )
+                )
+            )
+
+        total = 0
+        while True:
+            snapshot = routing_cache.get(db)
+            available, _ = AppealAssignmentService.get_available_operators_by_source(
+                db, snapshot, set(snapshot.weights)
+            )
+            if not available:
+                return total
+            pending = db.execute(query.where(models.Appeal.source_id.in_(available))).all()
+            assigned = AppealAssignmentService.assign_pending(db, pending)
+            total += assigned
+            # Stop when backlog is drained or capacity was taken concurrently
+            if len(pending) < batch_size or not assigned:
+                return total
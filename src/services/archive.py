@@ -0,0 +1,73 @@
+"""Retention job moving long-closed appeals to the archive table."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from src import models
+
+# Columns copied from appeals to appeals_archive
+ARCHIVED_COLUMNS = (
+    "id",
+    "lead_id",
+    "source_id",
+    "operator_id",
+    "message",
+    "is_active",
+    "created_at",
+    "closed_at",
+)
+
+
+class AppealArchiveService:
+    """
+    Moves appeals closed before a cutoff from `appeals` to `appeals_archive`
+    in bounded batches, one transaction per batch. Statistics counters and rollups
+    already count closed appeals and are left as is; lead history reads both tables.
+    """
+
+    @staticmethod
+    def archive_batch(db: Session, closed_before: datetime, batch_size: int) -> int:
+        """Move up to `batch_size` appeals closed before cutoff and commit. Returns number moved."""
+        appeal_ids = (
+            db.execute(
+                select(models.Appeal.id)
+                .where(models.Appeal.is_active == False, models.Appeal.closed_at < closed_before)
+                .order_by(models.Appeal.closed_at)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not appeal_ids:
+            return 0
+
+        db.execute(
+            insert(models.AppealArchive).from_select(
+                ARCHIVED_COLUMNS,
+                select(*(getattr(models.Appeal, column) for column in ARCHIVED_COLUMNS)).where(
+                    models.Appeal.id.in_(appeal_ids)
+                ),
+            )
+        )
+        db.execute(
+            delete(models.Appeal)
+            .where(models.Appeal.id.in_(appeal_ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return len(appeal_ids)
+
+    @staticmethod
+    def archive_closed(db: Session, older_than: timedelta, batch_size: int = 1000) -> int:
+        """Archive all appeals closed longer than `older_than` ago. Returns number moved."""
+        # Same clock as closed_at (UTC, naive)
+        closed_before = datetime.now(timezone.utc).replace(tzinfo=None) - older_than
+
+        total = 0
+        while True:
+            moved = AppealArchiveService.archive_batch(db, closed_before, batch_size)
+            total += moved
+            if moved < batch_size:
+                return total
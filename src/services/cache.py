@@ -0,0 +1,92 @@
+"""In-process cache of serialized statistics responses."""
+
+import asyncio
+import hashlib
+import itertools
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.config import settings
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized JSON body with its entity tag."""
+
+    body: bytes
+    etag: str
+    data_version: int
+    created_at: float
+
+
+class ResponseCache:
+    """
+    Serialized responses keyed by endpoint, valid for `ttl` seconds while the
+    process-local data version is unchanged. The version is bumped after every
+    committed transaction of this process (appeal writes, weight and operator changes);
+    writes made by other workers are picked up when the TTL expires.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._versions = itertools.count(1)
+        self.data_version = 0
+        self._entries: dict[str, CachedResponse] = {}
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def bump(self) -> None:
+        """Invalidate all entries (data changed)."""
+        self.data_version = next(self._versions)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Valid cached response, if any."""
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or entry.data_version != self.data_version
+            or time.monotonic() - entry.created_at >= self.ttl
+        ):
+            return None
+        return entry
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[bytes]]
+    ) -> CachedResponse:
+        """
+        Cached response, or serialized body computed by `compute` and cached.
+        Concurrent misses of the same key wait for a single computation.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+
+        async with self._locks[key]:
+            entry = self.get(key)
+            if entry is not None:
+                return entry
+
+            # Taken before computing: a write committed meanwhile invalidates the result
+            data_version = self.data_version
+            body = await compute()
+            entry = CachedResponse(
+                body=body,
+                etag=f'"{hashlib.sha1(body).hexdigest()}"',
+                data_version=data_version,
+                created_at=time.monotonic(),
+            )
+            if self.ttl > 0:
+                self._entries[key] = entry
+            return entry
+
+
+statistics_cache = ResponseCache(ttl=settings.statistics_cache_ttl)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_statistics_version(_: Session) -> None:
+    statistics_cache.bump()
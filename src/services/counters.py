@@ -0,0 +1,175 @@
+"""Incrementally maintained appeal counters and hourly rollups for statistics."""
+
+from collections import Counter, defaultdict
+from datetime import datetime
+
+from sqlalchemy import DateTime, case, delete, func, insert, select, type_coerce, union_all
+from sqlalchemy.orm import Session
+
+from src import models
+from src.database import dialect_insert
+
+
+def hour_start(value: datetime) -> datetime:
+    """Start of the hour containing value (rollup bucket)."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+class AppealCounterService:
+    """
+    Keeps `appeal_counters` (total and active appeals per source and operator) and
+    `appeal_rollups` (appeals created per hour, source and operator) in sync with appeals.
+    Every method runs in the caller's transaction and does not commit.
+    """
+
+    @staticmethod
+    def key(source_id: int, operator_id: int | None) -> tuple[int, int]:
+        """Counter key of appeal; unassigned appeals are counted under a sentinel operator."""
+        return source_id, operator_id if operator_id is not None else models.UNASSIGNED_OPERATOR_ID
+
+    @staticmethod
+    def apply_counters(db: Session, deltas: list[tuple[int, int | None, int, int]]) -> None:
+        """Add deltas given as (source_id, operator_id, total, active) to counters."""
+        merged = defaultdict(lambda: [0, 0])
+        for source_id, operator_id, total, active in deltas:
+            counter = merged[AppealCounterService.key(source_id, operator_id)]
+            counter[0] += total
+            counter[1] += active
+
+        # Rows in primary key order: concurrent transactions lock counters in the same
+        # order and cannot deadlock on PostgreSQL
+        rows = [
+            {"source_id": source_id, "operator_id": operator_id, "total": total, "active": active}
+            for (source_id, operator_id), (total, active) in sorted(merged.items())
+            if total or active
+        ]
+        if not rows:
+            return
+
+        stmt = dialect_insert(db, models.AppealCounter).values(rows)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[models.AppealCounter.source_id, models.AppealCounter.operator_id],
+                set_={
+                    "total": models.AppealCounter.total + stmt.excluded.total,
+                    "active": models.AppealCounter.active + stmt.excluded.active,
+                },
+            )
+        )
+
+    @staticmethod
+    def apply_rollups(db: Session, deltas: list[tuple[datetime, int, int | None, int]]) -> None:
+        """Add deltas given as (created_at, source_id, operator_id, appeals) to hourly rollups."""
+        merged = Counter()
+        for created_at, source_id, operator_id, appeals in deltas:
+            key = AppealCounterService.key(source_id, operator_id)
+            merged[(hour_start(created_at), *key)] += appeals
+
+        # Primary key order, as in apply_counters
+        rows = [
+            {
+                "bucket_start": bucket_start,
+                "source_id": source_id,
+                "operator_id": operator_id,
+                "appeals": appeals,
+            }
+            for (bucket_start, source_id, operator_id), appeals in sorted(merged.items())
+            if appeals
+        ]
+        if not rows:
+            return
+
+        stmt = dialect_insert(db, models.AppealRollup).values(rows)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[
+                    models.AppealRollup.bucket_start,
+                    models.AppealRollup.source_id,
+                    models.AppealRollup.operator_id,
+                ],
+                set_={"appeals": models.AppealRollup.appeals + stmt.excluded.appeals},
+            )
+        )
+
+    @staticmethod
+    def created(db: Session, appeals: list[tuple[int, int | None, datetime]]) -> None:
+        """Count new active appeals given as (source_id, operator_id, created_at)."""
+        AppealCounterService.apply_counters(
+            db, [(source_id, operator_id, 1, 1) for source_id, operator_id, _ in appeals]
+        )
+        AppealCounterService.apply_rollups(
+            db,
+            [
+                (created_at, source_id, operator_id, 1)
+                for source_id, operator_id, created_at in appeals
+            ],
+        )
+
+    @staticmethod
+    def assigned(db: Session, appeals: list[tuple[int, int, datetime]]) -> None:
+        """
+        Move active appeals given as (source_id, operator_id, created_at)
+        from unassigned to the operator they were assigned to.
+        """
+        counters, rollups = [], []
+        for source_id, operator_id, created_at in appeals:
+            counters += [(source_id, None, -1, -1), (source_id, operator_id, 1, 1)]
+            rollups += [(created_at, source_id, None, -1), (created_at, source_id, operator_id, 1)]
+        AppealCounterService.apply_counters(db, counters)
+        AppealCounterService.apply_rollups(db, rollups)
+
+    @staticmethod
+    def closed(db: Session, source_id: int, operator_id: int | None) -> None:
+        """Count closing of an active appeal."""
+        AppealCounterService.apply_counters(db, [(source_id, operator_id, 0, -1)])
+
+    @staticmethod
+    def hour_bucket(db: Session, column):
+        """
+        SQL expression truncating datetime column to the hour.
+        On SQLite the text matches how SQLAlchemy stores datetimes bound from Python,
+        so rebuilt buckets are equal to incrementally created ones.
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            return func.date_trunc("hour", column)
+        return type_coerce(func.strftime("%Y-%m-%d %H:00:00.000000", column), DateTime)
+
+    @staticmethod
+    def rebuild(db: Session) -> tuple[int, int]:
+        """
+        Recompute counters and rollups from appeals, hot and archived (repair).
+        Returns number of counter and rollup rows.
+        """
+        appeals = union_all(
+            *(
+                select(table.source_id, table.operator_id, table.is_active, table.created_at)
+                for table in (models.Appeal, models.AppealArchive)
+            )
+        ).subquery()
+
+        db.execute(delete(models.AppealCounter))
+        operator_id = func.coalesce(appeals.c.operator_id, models.UNASSIGNED_OPERATOR_ID)
+        counters = db.execute(
+            insert(models.AppealCounter).from_select(
+                ["source_id", "operator_id", "total", "active"],
+                select(
+                    appeals.c.source_id,
+                    operator_id,
+                    func.count(),
+                    func.sum(case((appeals.c.is_active == True, 1), else_=0)),
+                ).group_by(appeals.c.source_id, operator_id),
+            )
+        ).rowcount
+
+        db.execute(delete(models.AppealRollup))
+        bucket_start = AppealCounterService.hour_bucket(db, appeals.c.created_at)
+        rollups = db.execute(
+            insert(models.AppealRollup).from_select(
+                ["bucket_start", "source_id", "operator_id", "appeals"],
+                select(bucket_start, appeals.c.source_id, operator_id, func.count()).group_by(
+                    bucket_start, appeals.c.source_id, operator_id
+                ),
+            )
+        ).rowcount
+
+        return counters, rollups
@@ -0,0 +1,163 @@
+"""
+In-process dispatcher assigning appeals to operators in micro-batches:
+accepted appeals (deferred intake) and unassigned backlog when capacity is freed.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+
+from src.config import settings
+from src.database import session_scope
+from src.services.aio import AsyncAppealAssignmentService
+
+logger = logging.getLogger(__name__)
+
+
+class AppealDispatcher:
+    """
+    Bounded queue of accepted appeals served by a pool of worker tasks.
+    Each worker collects up to `batch_size` appeal ids (waiting at most
+    `batch_wait` seconds) and assigns them in one transaction.
+
+    A separate backfill task drains unassigned appeals in FIFO batches
+    for operators whose capacity was freed (see `notify_capacity`).
+    """
+
+    def __init__(self, workers: int, queue_size: int, batch_size: int, batch_wait: float):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self._queue: asyncio.Queue[int] | None = None
+        self._pending = 0
+        self._tasks: list[asyncio.Task] = []
+        self._in_flight: set[asyncio.Task] = set()
+        self._freed_operators: set[int | None] = set()
+        self._capacity_freed: asyncio.Event | None = None
+
+    @property
+    def pending(self) -> int:
+        """Appeals reserved or waiting in queue."""
+        return self._pending
+
+    def reserve(self) -> bool:
+        """Reserve queue slot before persisting appeal; False when queue is full."""
+        if self._pending >= self.queue_size:
+            return False
+        self._pending += 1
+        return True
+
+    def release(self) -> None:
+        """Give back reserved slot that was not submitted."""
+        self._pending -= 1
+
+    def submit(self, appeal_id: int) -> None:
+        """Queue appeal for assignment (slot must be reserved)."""
+        self._queue.put_nowait(appeal_id)
+
+    def notify_capacity(self, operator_id: int | None = None) -> None:
+        """
+        Operator capacity was freed (appeal closed, operator activated, limit raised):
+        drain unassigned appeals of its sources. None drains all sources.
+        """
+        if self._capacity_freed is None:
+            return
+        self._freed_operators.add(operator_id)
+        self._capacity_freed.set()
+
+    def start(self) -> None:
+        """Start worker tasks; backlog left from previous runs is drained first."""
+        self._queue = asyncio.Queue()
+        self._capacity_freed = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._backfill_worker()))
+        self.notify_capacity(None)
+
+    async def stop(self) -> None:
+        """
+        Stop worker tasks (unprocessed appeals stay unassigned in database).
+        Transactions already running are completed first.
+        """
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        await asyncio.gather(*self._in_flight)
+        self._tasks = []
+        self._capacity_freed = None
+
+    async def _run(self, transaction) -> None:
+        """
+        Run transaction coroutine shielded from cancellation of the worker:
+        a sync service call keeps running in threadpool when its awaiting task
+        is cancelled, so the session must not be closed under it.
+        """
+        task = asyncio.create_task(transaction)
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+        await asyncio.shield(task)
+
+    async def _assign(self, batch: list[int]) -> None:
+        try:
+            # No lock between workers: reservations and the conditional assignment
+            # keep max_load and skip appeals another worker got to first
+            async with session_scope() as db:
+                await AsyncAppealAssignmentService.assign_appeals(db, batch)
+        except Exception:
+            logger.exception("Failed to assign appeals %s", batch)
+
+    async def _backfill(self, operator_id: int | None) -> None:
+        try:
+            async with session_scope() as db:
+                await AsyncAppealAssignmentService.backfill_unassigned(
+                    db, operator_id, self.batch_size
+                )
+        except Exception:
+            logger.exception("Failed to backfill appeals for operator %s", operator_id)
+
+    async def _next_batch(self) -> list[int]:
+        """Wait for first appeal, then collect more until batch is full or time is out."""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_wait
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _worker(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._run(self._assign(batch))
+            finally:
+                self._pending -= len(batch)
+
+    async def _backfill_worker(self) -> None:
+        while True:
+            await self._capacity_freed.wait()
+            self._capacity_freed.clear()
+            # Notifications for the same operator are coalesced into one drain
+            operator_ids, self._freed_operators = self._freed_operators, set()
+            if None in operator_ids:
+                operator_ids = {None}
+
+            for operator_id in operator_ids:
+                await self._run(self._backfill(operator_id))
+
+
+appeal_dispatcher = AppealDispatcher(
+    workers=settings.dispatcher_workers,
+    queue_size=settings.dispatcher_queue_size,
+    batch_size=settings.dispatcher_batch_size,
+    batch_wait=settings.dispatcher_batch_wait,
+)
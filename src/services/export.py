@@ -0,0 +1,81 @@
+"""Streaming export of appeals as NDJSON or CSV."""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Literal
+
+from sqlalchemy import Row
+
+from src import database
+from src.config import settings
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Rows fetched from the server-side cursor and sent per chunk
+EXPORT_CHUNK_SIZE = 1000
+
+
+def _value(value):
+    """Serialize value the same way as JSON API responses."""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _encode_ndjson(rows: Sequence[Row]) -> str:
+    return "".join(
+        json.dumps({key: _value(value) for key, value in row._mapping.items()}, ensure_ascii=False)
+        + "\n"
+        for row in rows
+    )
+
+
+def _encode_csv(rows: Sequence[Row]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([[_value(value) for value in row] for row in rows])
+    return buffer.getvalue()
+
+
+def _encode(export_format: ExportFormat, rows: Sequence[Row]) -> str:
+    return _encode_ndjson(rows) if export_format == "ndjson" else _encode_csv(rows)
+
+
+def _header(export_format: ExportFormat, query) -> str:
+    """CSV header line (column names of query); NDJSON has none."""
+    if export_format != "csv":
+        return ""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow([column.name for column in query.selected_columns])
+    return buffer.getvalue()
+
+
+def _iter_sync(query, export_format: ExportFormat) -> Iterator[str]:
+    session_factory = database.read_session_factory()
+    with session_factory() as db:
+        yield _header(export_format, query)
+        result = db.execute(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        for rows in result.partitions():
+            yield _encode(export_format, rows)
+
+
+async def _iter_async(query, export_format: ExportFormat) -> AsyncIterator[str]:
+    session_factory = await database.async_read_session_factory()
+    async with session_factory() as db:
+        yield _header(export_format, query)
+        result = await db.stream(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        async for rows in result.partitions():
+            yield _encode(export_format, rows)
+
+
+def stream_export(query, export_format: ExportFormat) -> Iterator[str] | AsyncIterator[str]:
+    """
+    Encoded chunks of query rows, read with a server-side cursor (`yield_per`),
+    so memory does not depend on the number of rows.
+    The iterator opens its own read session (the primary's while the replica lags):
+    it outlives the request's session dependency.
+    """
+    if settings.database_async:
+        return _iter_async(query, export_format)
+    return _iter_sync(query, export_format)
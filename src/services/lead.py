@@ -0,0 +1,51 @@
+"""Lead service for querying leads and their appeals."""
+
+from sqlalchemy import select, union_all
+from sqlalchemy.orm import Session
+
+from src import models, schemas
+from src.services.appeal import AppealService
+from src.services.pagination import DEFAULT_PAGE_SIZE, Cursor, keyset_page
+
+
+class LeadService:
+    """Service for querying leads."""
+
+    @staticmethod
+    def get_leads(
+        db: Session, after: Cursor | None = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> schemas.Page[schemas.LeadResponse]:
+        """Get page of leads, oldest first."""
+        query = select(
+            models.Lead.id,
+            models.Lead.external_id,
+            models.Lead.name,
+            models.Lead.email,
+            models.Lead.phone,
+            models.Lead.created_at,
+        )
+        rows, next_cursor = keyset_page(
+            db, query, models.Lead.created_at, models.Lead.id, after, limit
+        )
+        return schemas.Page[schemas.LeadResponse](
+            items=[schemas.LeadResponse.model_validate(row._mapping) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def get_lead(db: Session, lead_id: int) -> models.Lead | None:
+        """Get lead by id."""
+        return db.query(models.Lead).filter(models.Lead.id == lead_id).first()
+
+    @staticmethod
+    def get_lead_appeals(db: Session, lead_id: int) -> list[schemas.AppealResponse]:
+        """Get all appeals of lead (from different sources), hot and archived, oldest first."""
+        appeals = union_all(
+            *(
+                AppealService.response_query(appeal).where(appeal.lead_id == lead_id)
+                for appeal in (models.Appeal, models.AppealArchive)
+            )
+        ).subquery()
+        return AppealService.to_responses(
+            db, select(appeals).order_by(appeals.c.created_at, appeals.c.id)
+        )
@@ -2,27 +2,58 @@
 
 from typing import List, Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src import models, schemas
+from src.services.routing import routing_cache
 
 
 class OperatorService:
     """Service for managing operators."""
 
     @staticmethod
-    def create_operator(db: Session, operator: schemas.OperatorCreate) -> models.Operator:
+    def get_operator_responses(
+        db: Session, operator_ids: list[int] | None = None
+    ) -> list[schemas.OperatorResponse]:
+        """Operators (all, or given ids) with current load, in a single query."""
+        query = select(
+            models.Operator.id,
+            models.Operator.name,
+            models.Operator.is_active,
+            models.Operator.max_load,
+            models.Operator.active_load.label("current_load"),
+        )
+        if operator_ids is not None:
+            query = query.where(models.Operator.id.in_(operator_ids))
+
+        return [
+            schemas.OperatorResponse.model_validate(row._mapping)
+            for row in db.execute(query.order_by(models.Operator.id)).all()
+        ]
+
+    @staticmethod
+    def get_operator_response(db: Session, operator_id: int) -> schemas.OperatorResponse | None:
+        """Operator with current load, None if not found."""
+        operators = OperatorService.get_operator_responses(db, [operator_id])
+        return operators[0] if operators else None
+
+    @staticmethod
+    def create_operator(db: Session, operator: schemas.OperatorCreate) -> schemas.OperatorResponse:
         """Create new operator."""
         db_operator = models.Operator(**operator.model_dump())
         db.add(db_operator)
+        routing_cache.bump_version(db)
+        db.flush()
+        operator_id = db_operator.id
         db.commit()
-        db.refresh(db_operator)
-        return db_operator
+        routing_cache.invalidate()
+        return OperatorService.get_operator_response(db, operator_id)
 
     @staticmethod
-    def get_operators(db: Session) -> list[models.Operator]:
-        """Get all operators."""
-        return db.query(models.Operator).all()
+    def get_operators(db: Session) -> list[schemas.OperatorResponse]:
+        """Get all operators with current load."""
+        return OperatorService.get_operator_responses(db)
 
     @staticmethod
     def get_operator(db: Session, operator_id: int) -> models.Operator | None:
@@ -32,7 +63,7 @@ class OperatorService:
     @staticmethod
     def update_operator(
         db: Session, operator_id: int, operator_update: schemas.OperatorUpdate
-    ) -> models.Operator | None:
+    ) -> schemas.OperatorResponse | None:
         """Update operator."""
         db_operator = OperatorService.get_operator(db, operator_id)
         if not db_operator:
@@ -42,6 +73,7 @@ class OperatorService:
         for field, value in update_data.items():
             setattr(db_operator, field, value)
 
+        routing_cache.bump_version(db)
         db.commit()
-        db.refresh(db_operator)
-        return db_operator
+        routing_cache.invalidate()
+        return OperatorService.get_operator_response(db, operator_id)
@@ -0,0 +1,67 @@
+"""Keyset pagination on (created_at, id)."""
+
+import base64
+from datetime import datetime
+
+from sqlalchemy import String, literal, tuple_, type_coerce
+from sqlalchemy.orm import Session
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# (created_at as stored in database, id) of the last row of a page
+Cursor = tuple[str, int]
+
+
+def encode_cursor(created_at: str, row_id: int) -> str:
+    """Opaque cursor pointing after the given row."""
+    return base64.urlsafe_b64encode(f"{created_at}|{row_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode cursor produced by `encode_cursor`; raises ValueError if it is malformed."""
+    created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    datetime.fromisoformat(created_at)
+    return created_at, int(row_id)
+
+
+def _stored_created_at(db: Session, created_at_column):
+    """
+    created_at as the database stores and orders it.
+    SQLite keeps datetimes as text in the format they were written with
+    (CURRENT_TIMESTAMP without microseconds, bound values with them), so the text
+    itself is read and compared; other databases have a native timestamp type.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return type_coerce(created_at_column, String)
+    return created_at_column
+
+
+def _cursor_value(db: Session, created_at: str):
+    """Bind value of cursor's created_at comparable with `_stored_created_at`."""
+    if db.get_bind().dialect.name == "sqlite":
+        return literal(created_at, String)
+    return literal(datetime.fromisoformat(created_at))
+
+
+def keyset_page(db: Session, query, created_at_column, id_column, after: Cursor | None, limit: int):
+    """
+    Execute page of `query` ordered by (created_at, id), starting after cursor.
+    Returns (rows, next cursor or None); one extra row is fetched to detect the last page.
+    """
+    stored_created_at = _stored_created_at(db, created_at_column)
+    query = query.add_columns(stored_created_at.label("cursor_created_at"))
+    if after is not None:
+        created_at, row_id = after
+        query = query.where(
+            tuple_(stored_created_at, id_column)
+            > tuple_(_cursor_value(db, created_at), literal(row_id))
+        )
+
+    rows = db.execute(query.order_by(created_at_column, id_column).limit(limit + 1)).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1].cursor_created_at
+    return rows, encode_cursor(last if isinstance(last, str) else last.isoformat(), rows[-1].id)
@@ -0,0 +1,137 @@
+"""Per-request SQL profiling: statements and database time of each HTTP request."""
+
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, event
+
+from src import database, schemas
+from src.config import settings
+
+# Characters of the slowest statement kept (whitespace collapsed)
+STATEMENT_PREVIEW = 300
+
+
+@dataclass
+class RequestProfile:
+    """Statements executed while serving one request."""
+
+    statements: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+
+    def add(self, statement: str, duration: float) -> None:
+        self.statements += 1
+        self.db_time += duration
+        if duration >= self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        """`Server-Timing` header value (durations in milliseconds)."""
+        return (
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.statements} statements", '
+            f"db-slowest;dur={self.slowest_time * 1000:.2f}"
+        )
+
+
+@dataclass
+class ProfileRecord:
+    route: str
+    profile: RequestProfile
+    duration: float
+
+
+# Statements are attributed to the request running in the current context:
+# handlers' threadpool calls and async sessions' greenlets inherit it
+current_profile: ContextVar[RequestProfile | None] = ContextVar("current_profile", default=None)
+
+
+def application_engines() -> set[Engine]:
+    """Engines executing the application's statements, sync engines of async ones included."""
+    engines = {database.engine, database.read_engine}
+    for async_engine in (database.async_engine, database.async_read_engine):
+        if async_engine is not None:
+            engines.add(async_engine.sync_engine)
+    return engines
+
+
+# Start time is kept on the statement's execution context, which is dropped with it
+# (also when the statement fails and no after event fires)
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and current_profile.get() is not None:
+        context._profile_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    profile = current_profile.get()
+    started = getattr(context, "_profile_started", None)
+    if profile is None or started is None:
+        return
+    profile.add(statement, time.perf_counter() - started)
+
+
+class SQLProfiler:
+    """
+    Rolling window of the last `window` request profiles with per-route summary.
+    Profiles are recorded by `SQLProfilingMiddleware` on the event loop.
+    """
+
+    def __init__(self, window: int):
+        self._records: deque[ProfileRecord] = deque(maxlen=window)
+
+    @staticmethod
+    def install() -> None:
+        """Attribute statements of the application's engines to `current_profile`."""
+        for engine in application_engines():
+            for name, listener in (
+                ("before_cursor_execute", _before_cursor_execute),
+                ("after_cursor_execute", _after_cursor_execute),
+            ):
+                if not event.contains(engine, name, listener):
+                    event.listen(engine, name, listener)
+
+    def record(self, route: str, profile: RequestProfile, duration: float) -> None:
+        self._records.append(ProfileRecord(route, profile, duration))
+
+    def clear(self) -> None:
+        self._records.clear()
+
+    def summary(self) -> list[schemas.RouteProfile]:
+        """Routes of the window ranked by total database time."""
+        routes: dict[str, list[ProfileRecord]] = {}
+        for record in self._records:
+            routes.setdefault(record.route, []).append(record)
+
+        summary = []
+        for route, records in routes.items():
+            requests = len(records)
+            statements = sum(record.profile.statements for record in records)
+            db_time = sum(record.profile.db_time for record in records)
+            slowest = max(records, key=lambda record: record.profile.slowest_time).profile
+            summary.append(
+                schemas.RouteProfile(
+                    route=route,
+                    requests=requests,
+                    statements=statements,
+                    statements_per_request=round(statements / requests, 2),
+                    db_time_ms=round(db_time * 1000, 2),
+                    db_time_per_request_ms=round(db_time * 1000 / requests, 3),
+                    request_time_per_request_ms=round(
+                        sum(record.duration for record in records) * 1000 / requests, 3
+                    ),
+                    slowest_statement_ms=round(slowest.slowest_time * 1000, 3),
+                    slowest_statement=(
+                        " ".join(slowest.slowest_statement.split())[:STATEMENT_PREVIEW]
+                        if slowest.slowest_statement
+                        else None
+                    ),
+                )
+            )
+        return sorted(summary, key=lambda route: route.db_time_ms, reverse=True)
+
+
+sql_profiler = SQLProfiler(window=settings.sql_profiling_window)
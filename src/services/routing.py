@@ -0,0 +1,150 @@
+"""Versioned in-process snapshot of routing configuration."""
+
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src import models
+from src.config import settings
+from src.database import dialect_insert
+from src.services.sampler import AliasSampler
+
+ROUTING_VERSION_ID = 1
+
+
+@dataclass(frozen=True)
+class OperatorInfo:
+    """Routing-relevant operator fields."""
+
+    id: int
+    name: str
+    is_active: bool
+    max_load: int
+
+
+@dataclass(frozen=True)
+class RoutingSnapshot:
+    """
+    Immutable routing configuration: sources, operator flags and weights,
+    with a precomputed weighted sampler per source.
+    """
+
+    version: int
+    sources: Mapping[int, str]
+    operators: Mapping[int, OperatorInfo]
+    # source_id -> ((operator_id, weight), ...) of active operators
+    weights: Mapping[int, tuple[tuple[int, int], ...]]
+    samplers: Mapping[int, AliasSampler] = field(repr=False)
+
+    def candidates(self, source_id: int) -> list[tuple[OperatorInfo, int]]:
+        """Active operators of source with weights."""
+        return [
+            (self.operators[operator_id], weight)
+            for operator_id, weight in self.weights.get(source_id, ())
+        ]
+
+
+class RoutingCache:
+    """
+    Holds current RoutingSnapshot, swapped atomically on reload.
+    Writes through SourceService/OperatorService bump the version row in the
+    database, so every process notices changes with one primary key lookup
+    (done at most every `ttl` seconds).
+    """
+
+    def __init__(self, ttl: float):
+        # Seconds a snapshot is used without checking version in database
+        self.ttl = ttl
+        self._snapshot: RoutingSnapshot | None = None
+        self._checked_at = 0.0
+        self._generation = 0
+
+    @staticmethod
+    def get_version(db: Session) -> int:
+        """Current routing version stored in database."""
+        version = db.execute(
+            select(models.RoutingVersion.version).where(
+                models.RoutingVersion.id == ROUTING_VERSION_ID
+            )
+        ).scalar()
+        return version or 0
+
+    @staticmethod
+    def bump_version(db: Session) -> None:
+        """Increment routing version in the current transaction (caller commits)."""
+        stmt = dialect_insert(db, models.RoutingVersion).values(id=ROUTING_VERSION_ID, version=1)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[models.RoutingVersion.id],
+                set_={"version": models.RoutingVersion.version + 1},
+            )
+        )
+
+    @staticmethod
+    def load(db: Session, version: int) -> RoutingSnapshot:
+        """Read routing configuration from database."""
+        sources = dict(db.execute(select(models.Source.id, models.Source.name)).all())
+        operators = {
+            row.id: OperatorInfo(
+                id=row.id, name=row.name, is_active=row.is_active, max_load=row.max_load
+            )
+            for row in db.execute(
+                select(
+                    models.Operator.id,
+                    models.Operator.name,
+                    models.Operator.is_active,
+                    models.Operator.max_load,
+                )
+            ).all()
+        }
+
+        weights: dict[int, list[tuple[int, int]]] = {}
+        for source_id, operator_id, weight in db.execute(
+            select(
+                models.OperatorSourceWeight.source_id,
+                models.OperatorSourceWeight.operator_id,
+                models.OperatorSourceWeight.weight,
+            ).order_by(models.OperatorSourceWeight.id)
+        ).all():
+            if operators[operator_id].is_active:
+                weights.setdefault(source_id, []).append((operator_id, weight))
+
+        return RoutingSnapshot(
+            version=version,
+            sources=MappingProxyType(sources),
+            operators=MappingProxyType(operators),
+            weights=MappingProxyType({k: tuple(v) for k, v in weights.items()}),
+            samplers=MappingProxyType({k: AliasSampler(v) for k, v in weights.items()}),
+        )
+
+    def get(self, db: Session, refresh: bool = False) -> RoutingSnapshot:
+        """
+        Get current snapshot, reloading it if database version changed.
+        Version is checked at most every `ttl` seconds unless `refresh` is set.
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and not refresh and now - self._checked_at < self.ttl:
+            return snapshot
+
+        generation = self._generation
+        version = self.get_version(db)
+        if snapshot is None or snapshot.version != version:
+            snapshot = self.load(db, version)
+            self._snapshot = snapshot
+        # A check that raced with a local change must not postpone the next one
+        if generation == self._generation:
+            self._checked_at = now
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Force version check on next access (after a committed routing change)."""
+        self._generation += 1
+        self._checked_at = 0.0
+
+
+routing_cache = RoutingCache(ttl=settings.routing_version_ttl)
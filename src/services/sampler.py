@@ -0,0 +1,74 @@
+"""Precomputed weighted samplers for operator selection."""
+
+import random
+from collections.abc import Container
+
+# Rejected draws (masked operators) before falling back to a linear weighted choice
+MAX_REJECTIONS = 8
+
+
+class AliasSampler:
+    """
+    Walker's alias table over weighted operators of a source.
+    Built once per weight configuration, each draw is O(1).
+    """
+
+    def __init__(self, weights: list[tuple[int, int]]):
+        self.operator_ids = [operator_id for operator_id, _ in weights]
+        self.weights = [weight for _, weight in weights]
+
+        size = len(self.weights)
+        total = sum(self.weights)
+        self._prob = [1.0] * size
+        self._alias = list(range(size))
+        if not total:
+            return
+
+        scaled = [weight * size / total for weight in self.weights]
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+    def __len__(self) -> int:
+        return len(self.operator_ids)
+
+    def _draw(self) -> int:
+        """Draw one operator id from the full table."""
+        i = random.randrange(len(self.operator_ids))
+        if random.random() >= self._prob[i]:
+            i = self._alias[i]
+        return self.operator_ids[i]
+
+    def sample(self, available: Container[int] | None = None) -> int | None:
+        """
+        Select operator id by weight.
+        Operators not in `available` (e.g. at capacity) are masked out
+        by rejection, so the table is not rebuilt when load changes.
+        """
+        if not self.operator_ids:
+            return None
+
+        for _ in range(MAX_REJECTIONS):
+            operator_id = self._draw()
+            if available is None or operator_id in available:
+                return operator_id
+
+        # Most of the weight is masked out: choose among the remaining operators directly
+        candidates = [
+            (operator_id, weight)
+            for operator_id, weight in zip(self.operator_ids, self.weights)
+            if operator_id in available
+        ]
+        if not candidates:
+            return None
+        return random.choices(
+            [operator_id for operator_id, _ in candidates],
+            weights=[weight for _, weight in candidates],
+            k=1,
+        )[0]
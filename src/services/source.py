@@ -2,9 +2,10 @@
 
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from src import models, schemas
+from src.services.routing import routing_cache
 
 
 class SourceService:
@@ -15,7 +16,9 @@ class SourceService:
         """Create new source."""
         db_source = models.Source(**source.model_dump())
         db.add(db_source)
+        routing_cache.bump_version(db)
         db.commit()
+        routing_cache.invalidate()
         db.refresh(db_source)
         return db_source
 
@@ -42,27 +45,28 @@ class SourceService:
             models.OperatorSourceWeight.source_id == config.source_id
         ).delete()
 
-        new_weights = []
         for weight_config in config.weights:
-            weight = models.OperatorSourceWeight(
-                operator_id=weight_config.operator_id,
-                source_id=config.source_id,
-                weight=weight_config.weight,
+            db.add(
+                models.OperatorSourceWeight(
+                    operator_id=weight_config.operator_id,
+                    source_id=config.source_id,
+                    weight=weight_config.weight,
+                )
             )
-            db.add(weight)
-            new_weights.append(weight)
 
+        routing_cache.bump_version(db)
         db.commit()
-        for weight in new_weights:
-            db.refresh(weight)
+        routing_cache.invalidate()
 
-        return new_weights
+        return SourceService.get_source_weights(db, config.source_id)
 
     @staticmethod
     def get_source_weights(db: Session, source_id: int) -> list[models.OperatorSourceWeight]:
-        """Get all weight configurations for a source."""
+        """Get all weight configurations for a source (with operators loaded)."""
         return (
             db.query(models.OperatorSourceWeight)
+            .options(joinedload(models.OperatorSourceWeight.operator))
             .filter(models.OperatorSourceWeight.source_id == source_id)
+            .order_by(models.OperatorSourceWeight.id)
             .all()
         )
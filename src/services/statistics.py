@@ -1,8 +1,10 @@
 """Statistics service for optimized data aggregation."""
 
+from collections import defaultdict
+from datetime import datetime, timedelta
 from typing import List
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from sqlalchemy.orm import Session
 
 from src import models, schemas
@@ -14,35 +16,21 @@ class StatisticsService:
     @staticmethod
     def get_operator_statistics(db: Session) -> list[schemas.OperatorStatistics]:
         """
-        Get statistics for all operators with optimized query.
+        Get statistics for all operators.
+        Reads appeal counters (operators x sources rows), not the appeals table.
         """
-        # Subquery for active appeals count (current_load)
-        active_appeals_subq = (
-            select(models.Appeal.operator_id, func.count(models.Appeal.id).label("active_count"))
-            .where(models.Appeal.is_active == True)
-            .group_by(models.Appeal.operator_id)
-            .subquery()
-        )
-
-        # Subquery for total appeals count
-        total_appeals_subq = (
-            select(models.Appeal.operator_id, func.count(models.Appeal.id).label("total_count"))
-            .group_by(models.Appeal.operator_id)
-            .subquery()
-        )
-
-        # Main query with LEFT JOINs
         query = (
             db.query(
                 models.Operator.id,
                 models.Operator.name,
                 models.Operator.is_active,
                 models.Operator.max_load,
-                func.coalesce(active_appeals_subq.c.active_count, 0).label("current_load"),
-                func.coalesce(total_appeals_subq.c.total_count, 0).label("total_contacts"),
+                func.coalesce(func.sum(models.AppealCounter.active), 0).label("current_load"),
+                func.coalesce(func.sum(models.AppealCounter.total), 0).label("total_contacts"),
             )
-            .outerjoin(active_appeals_subq, models.Operator.id == active_appeals_subq.c.operator_id)
-            .outerjoin(total_appeals_subq, models.Operator.id == total_appeals_subq.c.operator_id)
+            .outerjoin(models.AppealCounter, models.Operator.id == models.AppealCounter.operator_id)
+            .group_by(models.Operator.id)
+            .order_by(models.Operator.id)
         )
 
         results = query.all()
@@ -59,61 +47,68 @@ class StatisticsService:
             for row in results
         ]
 
+    # Bucket sizes of source timeline and limits per request: buckets of the range
+    # and hourly rollup rows (source x operator cells with appeals) read
+    TIMELINE_STEPS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+    MAX_TIMELINE_BUCKETS = 24 * 31
+    MAX_TIMELINE_CELLS = 50_000
+
     @staticmethod
-    def get_source_statistics(db: Session) -> list[schemas.SourceStatistics]:
+    def get_sources_with_weights(db: Session) -> tuple[list[Row], dict[int, list[Row]]]:
+        """All sources and their operator weights (with operator names)."""
+        sources = db.execute(
+            select(models.Source.id, models.Source.name).order_by(models.Source.id)
+        ).all()
+
+        weights = defaultdict(list)
+        for row in db.execute(
+            select(
+                models.OperatorSourceWeight.source_id,
+                models.OperatorSourceWeight.operator_id,
+                models.OperatorSourceWeight.weight,
+                models.Operator.name,
+            ).join(models.Operator, models.OperatorSourceWeight.operator_id == models.Operator.id)
+            # Same order as the per-source lookup by (source_id, operator_id) index
+            .order_by(
+                models.OperatorSourceWeight.source_id, models.OperatorSourceWeight.operator_id
+            )
+        ).all():
+            weights[row.source_id].append(row)
+
+        return sources, weights
+
+    @staticmethod
+    def build_source_statistics(
+        sources: list[Row], weights: dict[int, list[Row]], contacts: dict[tuple[int, int], int]
+    ) -> list[schemas.SourceStatistics]:
         """
-        Get statistics for all sources with detailed operator distribution.
-        Shows weights, expected vs actual distribution percentages.
+        Build source statistics from contacts per (source_id, operator_id),
+        including the unassigned sentinel operator.
         """
-        sources = db.query(models.Source).all()
-        result = []
+        total_contacts = defaultdict(int)
+        for (source_id, _), count in contacts.items():
+            total_contacts[source_id] += count
 
+        result = []
         for source in sources:
-            # Get all operator weights for this source
-            weights = (
-                db.query(models.OperatorSourceWeight, models.Operator.name)
-                .join(
-                    models.Operator, models.OperatorSourceWeight.operator_id == models.Operator.id
-                )
-                .filter(models.OperatorSourceWeight.source_id == source.id)
-                .all()
-            )
+            source_weights = weights.get(source.id, [])
+            total_weight = sum(w.weight for w in source_weights)
+            total = total_contacts[source.id]
 
-            # Calculate total weight and total contacts
-            total_weight = sum(w[0].weight for w in weights)
-            total_contacts = (
-                db.query(func.count(models.Appeal.id))
-                .filter(models.Appeal.source_id == source.id)
-                .scalar()
-                or 0
-            )
-
-            # Build operator distribution details
             operators_details = []
-            for weight_record, operator_name in weights:
-                # Count contacts for this operator from this source
-                contacts_count = (
-                    db.query(func.count(models.Appeal.id))
-                    .filter(
-                        models.Appeal.source_id == source.id,
-                        models.Appeal.operator_id == weight_record.operator_id,
-                    )
-                    .scalar()
-                    or 0
-                )
+            for weight_record in source_weights:
+                contacts_count = contacts.get((source.id, weight_record.operator_id), 0)
 
                 # Calculate percentages
                 expected_percent = (
                     (weight_record.weight / total_weight * 100) if total_weight > 0 else 0
                 )
-                actual_percent = (
-                    (contacts_count / total_contacts * 100) if total_contacts > 0 else 0
-                )
+                actual_percent = (contacts_count / total * 100) if total > 0 else 0
 
                 operators_details.append(
                     schemas.OperatorAppealDetail(
                         operator_id=weight_record.operator_id,
-                        operator_name=operator_name,
+                        operator_name=weight_record.name,
                         weight=weight_record.weight,
                         contacts_count=contacts_count,
                         expected_percent=round(expected_percent, 2),
@@ -125,10 +120,132 @@ class StatisticsService:
                 schemas.SourceStatistics(
                     id=source.id,
                     name=source.name,
-                    total_contacts=total_contacts,
-                    operators_count=len(weights),
+                    total_contacts=total,
+                    operators_count=len(source_weights),
                     operators=operators_details,
                 )
             )
 
         return result
+
+    @staticmethod
+    def get_source_statistics(db: Session) -> list[schemas.SourceStatistics]:
+        """
+        Get statistics for all sources with detailed operator distribution.
+        Shows weights, expected vs actual distribution percentages.
+        Costs a constant number of queries: sources, weights and appeal counters.
+        """
+        sources, weights = StatisticsService.get_sources_with_weights(db)
+        contacts = {
+            (source_id, operator_id): total
+            for source_id, operator_id, total in db.execute(
+                select(
+                    models.AppealCounter.source_id,
+                    models.AppealCounter.operator_id,
+                    models.AppealCounter.total,
+                )
+            ).all()
+        }
+        return StatisticsService.build_source_statistics(sources, weights, contacts)
+
+    @staticmethod
+    def bucket_start(value: datetime, granularity: str) -> datetime:
+        """Start of the timeline bucket containing value."""
+        value = value.replace(minute=0, second=0, microsecond=0)
+        if granularity == "day":
+            value = value.replace(hour=0)
+        return value
+
+    @staticmethod
+    def get_source_timeline(
+        db: Session, start: datetime, end: datetime, granularity: str
+    ) -> schemas.SourceTimeline | None:
+        """
+        Source statistics per hour or day bucket in [start, end), read from hourly rollups.
+        Only buckets and (source, operator) cells with appeals are returned; expected
+        distribution uses current weights and is given once per source.
+        None when the range holds more than MAX_TIMELINE_CELLS rollup rows.
+        Datetimes are naive UTC.
+        """
+        step = StatisticsService.TIMELINE_STEPS[granularity]
+        first_bucket = StatisticsService.bucket_start(start, granularity)
+
+        rows = db.execute(
+            select(
+                models.AppealRollup.bucket_start,
+                models.AppealRollup.source_id,
+                models.AppealRollup.operator_id,
+                models.AppealRollup.appeals,
+            )
+            .where(
+                models.AppealRollup.bucket_start >= first_bucket,
+                models.AppealRollup.bucket_start < end,
+            )
+            .limit(StatisticsService.MAX_TIMELINE_CELLS + 1)
+        ).all()
+        if len(rows) > StatisticsService.MAX_TIMELINE_CELLS:
+            return None
+
+        # bucket -> source_id -> operator_id -> appeals
+        contacts = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+        for bucket_start, source_id, operator_id, appeals in rows:
+            bucket = StatisticsService.bucket_start(bucket_start, granularity)
+            contacts[bucket][source_id][operator_id] += appeals
+
+        sources, weights = StatisticsService.get_sources_with_weights(db)
+
+        timeline_sources = []
+        for source in sources:
+            source_weights = weights.get(source.id, [])
+            total_weight = sum(w.weight for w in source_weights)
+            timeline_sources.append(
+                schemas.TimelineSource(
+                    id=source.id,
+                    name=source.name,
+                    operators=[
+                        schemas.TimelineOperator(
+                            operator_id=w.operator_id,
+                            operator_name=w.name,
+                            weight=w.weight,
+                            expected_percent=(
+                                round(w.weight / total_weight * 100, 2) if total_weight > 0 else 0
+                            ),
+                        )
+                        for w in source_weights
+                    ],
+                )
+            )
+
+        buckets = []
+        for bucket in sorted(contacts):
+            bucket_sources = []
+            for source_id, operators in sorted(contacts[bucket].items()):
+                total = sum(operators.values())
+                bucket_sources.append(
+                    schemas.TimelineSourceBucket(
+                        source_id=source_id,
+                        total_contacts=total,
+                        operators=[
+                            schemas.TimelineCell(
+                                operator_id=operator_id,
+                                contacts_count=count,
+                                actual_percent=round(count / total * 100, 2),
+                            )
+                            for operator_id, count in sorted(operators.items())
+                            if operator_id != models.UNASSIGNED_OPERATOR_ID
+                        ],
+                    )
+                )
+            buckets.append(
+                schemas.SourceStatisticsBucket(
+                    start=bucket, end=bucket + step, sources=bucket_sources
+                )
+            )
+
+        return schemas.SourceTimeline(
+            start=first_bucket,
+            end=end,
+            granularity=granularity,
+            sources=timeline_sources,
+            buckets=buckets,
+        )
@@ -0,0 +1,63 @@
+"""
+Shared fixtures: the application on a temporary SQLite database.
+
+Engines are created when src.database is imported, so the database URL is set
+before the application is imported. Tables are dropped after every test and the
+next client start creates the schema again.
+"""
+
+import os
+import tempfile
+from collections.abc import Iterator
+
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/crm_leads_test.db"
+# Tests expect appeals to be assigned within the request
+os.environ["APPEAL_INTAKE_MODE"] = "sync"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from src import database
+from src.main import app
+from src.models import Base
+from src.services.cache import statistics_cache
+from src.services.profiling import application_engines
+from src.services.routing import routing_cache
+
+
+@pytest.fixture
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
+
+    Base.metadata.drop_all(database.engine)
+    routing_cache.invalidate()
+    statistics_cache.bump()
+
+
+@pytest.fixture
+def source_id(client: TestClient) -> int:
+    """Source with one operator of large capacity."""
+    operator = client.post("/operators", json={"name": "Operator", "max_load": 1000}).json()
+    source = client.post("/sources", json={"name": "Telegram"}).json()
+    client.post(
+        f"/sources/{source['id']}/weights", json=[{"operator_id": operator["id"], "weight": 1}]
+    )
+    return source["id"]
+
+
+@pytest.fixture
+def statements(client: TestClient) -> Iterator[list[str]]:
+    """SQL statements executed on the database engines; clear the list to start counting."""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engines = application_engines()
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,41 @@
+"""Appeal listings run a fixed number of statements whatever the number of rows."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def create_appeals(client: TestClient, source_id: int, count: int) -> None:
+    response = client.post(
+        "/appeals/batch", json=[{"lead_external_id": "lead-1", "source_id": source_id}] * count
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("rows", [1, 50])
+def test_list_appeals_runs_one_statement(
+    client: TestClient, source_id: int, statements: list[str], rows: int
+):
+    create_appeals(client, source_id, rows)
+
+    statements.clear()
+    response = client.get("/appeals", params={"limit": 100})
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == rows
+    assert len(statements) == 1
+
+
+@pytest.mark.parametrize("rows", [1, 50])
+def test_list_lead_appeals_runs_two_statements(
+    client: TestClient, source_id: int, statements: list[str], rows: int
+):
+    create_appeals(client, source_id, rows)
+    lead_id = client.get("/leads").json()["items"][0]["id"]
+
+    statements.clear()
+    response = client.get(f"/leads/{lead_id}/appeals")
+
+    assert response.status_code == 200
+    assert len(response.json()) == rows
+    # Lead lookup and the listing
+    assert len(statements) == 2
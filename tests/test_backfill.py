@@ -0,0 +1,41 @@
+"""Draining unassigned appeals is not blocked by sources nobody can take."""
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from src import database, models
+from src.services import AppealAssignmentService
+
+CREATED_AT = datetime(2026, 1, 1, 10)
+
+
+def test_backfill_skips_sources_without_capacity(client: TestClient, source_id: int):
+    orphan_id = client.post("/sources", json={"name": "No operators"}).json()["id"]
+    with database.SessionLocal() as db:
+        lead = models.Lead(external_id="lead-1", name="Lead")
+        db.add(lead)
+        db.flush()
+        # Oldest appeals fill whole batches but their source has no operators
+        db.add_all(
+            models.Appeal(
+                lead_id=lead.id, source_id=orphan_id, created_at=CREATED_AT + timedelta(seconds=i)
+            )
+            for i in range(10)
+        )
+        db.add_all(
+            models.Appeal(
+                lead_id=lead.id, source_id=source_id, created_at=CREATED_AT + timedelta(hours=1)
+            )
+            for _ in range(5)
+        )
+        db.commit()
+
+        assigned = AppealAssignmentService.backfill_unassigned(db, None, batch_size=5)
+        unassigned = db.execute(
+            select(models.Appeal.source_id).where(models.Appeal.operator_id.is_(None))
+        ).scalars()
+
+        assert assigned == 5
+        assert set(unassigned) == {orphan_id}
@@ -0,0 +1,90 @@
+"""Concurrent intake and closing keep operator load within max_load and keep up throughput."""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from src import database, models
+
+OPERATORS = 5
+MAX_LOAD = 10
+REQUESTS = 300
+CONCURRENCY = 16
+# Requests per second: a generous floor (about 85 on one CPU) that catches requests
+# waiting on locks or retrying; the benchmark suite measures actual throughput
+MIN_THROUGHPUT = 10
+
+
+@pytest.fixture
+def source_ids(client: TestClient) -> list[int]:
+    operators = [
+        client.post("/operators", json={"name": f"Operator {i}", "max_load": MAX_LOAD}).json()
+        for i in range(OPERATORS)
+    ]
+    source_ids = []
+    for name in ("Telegram", "WhatsApp"):
+        source = client.post("/sources", json={"name": name}).json()
+        weights = [
+            {"operator_id": operator["id"], "weight": weight}
+            for weight, operator in enumerate(operators, start=1)
+        ]
+        client.post(f"/sources/{source['id']}/weights", json=weights)
+        source_ids.append(source["id"])
+    return source_ids
+
+
+def test_concurrent_requests_keep_operator_load(client: TestClient, source_ids: list[int]):
+    def request(i: int) -> int:
+        source_id = source_ids[i % len(source_ids)]
+        if i % 5 == 0:
+            # Batches share new leads with each other and with single appeals
+            batch = [
+                {"lead_external_id": f"lead-{(i + k) % 20}", "source_id": source_id}
+                for k in range(5)
+            ]
+            return client.post("/appeals/batch", json=batch).status_code
+        if i % 5 == 1:
+            appeals = client.get("/appeals", params={"is_active": True}).json()["items"]
+            assigned = [appeal for appeal in appeals if appeal["operator_id"] is not None]
+            if assigned:
+                appeal_id = random.Random(i).choice(assigned)["id"]
+                return client.post(f"/appeals/{appeal_id}/close").status_code
+            return 200
+        appeal = {"lead_external_id": f"lead-{i % 20}", "source_id": source_id}
+        return client.post("/appeals", json=appeal).status_code
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        statuses = list(pool.map(request, range(REQUESTS)))
+    throughput = REQUESTS / (time.perf_counter() - started)
+
+    assert set(statuses) <= {200, 201}
+    assert throughput >= MIN_THROUGHPUT
+
+    with database.SessionLocal() as db:
+        active_appeals = dict(
+            db.execute(
+                select(models.Appeal.operator_id, func.count())
+                .where(models.Appeal.is_active == True, models.Appeal.operator_id.is_not(None))
+                .group_by(models.Appeal.operator_id)
+            ).all()
+        )
+        active_load = dict(
+            db.execute(select(models.Operator.id, models.Operator.active_load)).all()
+        )
+        unassigned = db.execute(
+            select(func.count()).where(
+                models.Appeal.is_active == True, models.Appeal.operator_id.is_(None)
+            )
+        ).scalar_one()
+
+    # Requests outnumber capacity: operators filled up and the rest waits unassigned
+    assert unassigned > 0
+    assert max(active_load.values()) <= MAX_LOAD
+    assert active_load == {
+        operator_id: active_appeals.get(operator_id, 0) for operator_id in active_load
+    }
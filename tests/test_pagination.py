@@ -0,0 +1,70 @@
+"""Keyset pagination visits every row once, whatever the stored created_at format."""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src import database, models
+from src.services import AppealService
+from src.services.pagination import decode_cursor
+
+CREATED_AT = datetime(2026, 1, 1, 10)
+
+
+@pytest.fixture
+def lead_id(client: TestClient) -> int:
+    with database.SessionLocal() as db:
+        lead = models.Lead(external_id="lead-1", name="Lead")
+        db.add(lead)
+        db.commit()
+        return lead.id
+
+
+def test_pages_of_appeals_with_equal_created_at(client: TestClient, source_id: int, lead_id: int):
+    with database.SessionLocal() as db:
+        appeals = [
+            models.Appeal(lead_id=lead_id, source_id=source_id, created_at=CREATED_AT)
+            for _ in range(4)
+        ]
+        db.add_all(appeals)
+        db.commit()
+        appeal_ids = [appeal.id for appeal in appeals]
+
+        first = AppealService.get_appeals(db, limit=2)
+        second = AppealService.get_appeals(db, after=decode_cursor(first.next_cursor), limit=2)
+
+    assert [appeal.id for appeal in first.items] == appeal_ids[:2]
+    assert [appeal.id for appeal in second.items] == appeal_ids[2:]
+    assert second.next_cursor is None
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_cursor_walks_mixed_created_at_formats(
+    client: TestClient, source_id: int, lead_id: int, limit: int
+):
+    # SQLite stores server-side CURRENT_TIMESTAMP without microseconds and bound
+    # datetimes with them: both formats of the same instant are present
+    with database.engine.begin() as conn:
+        for created_at in ("2026-01-01 10:00:00", "2026-01-01 10:00:00.000000") * 2:
+            conn.execute(
+                text(
+                    "INSERT INTO appeals (lead_id, source_id, is_active, created_at) "
+                    "VALUES (:lead_id, :source_id, 1, :created_at)"
+                ),
+                {"lead_id": lead_id, "source_id": source_id, "created_at": created_at},
+            )
+
+    expected = [appeal["id"] for appeal in client.get("/appeals").json()["items"]]
+    ids, cursor = [], None
+    while len(ids) <= len(expected):
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/appeals", params=params).json()
+        ids += [appeal["id"] for appeal in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(expected) == 4
+    assert ids == expected
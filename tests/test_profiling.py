@@ -0,0 +1,40 @@
+"""SQL profiler attributes statements to the profile of the current context."""
+
+import time
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+from src import database
+from src.services.profiling import RequestProfile, current_profile, sql_profiler
+
+
+def test_failed_statement_leaves_no_start_time():
+    sql_profiler.install()
+    profile = RequestProfile()
+    late_profile = RequestProfile()
+
+    def set_profile_late(conn, cursor, statement, parameters, context, executemany):
+        # Profile appears after the statement started: it must not be timed
+        if statement == "SELECT 2":
+            current_profile.set(late_profile)
+
+    token = current_profile.set(profile)
+    event.listen(database.engine, "before_cursor_execute", set_profile_late)
+    try:
+        with database.engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.rollback()
+            conn.execute(text("SELECT 1"))
+            time.sleep(0.1)
+            current_profile.set(None)
+            conn.execute(text("SELECT 2"))
+    finally:
+        event.remove(database.engine, "before_cursor_execute", set_profile_late)
+        current_profile.reset(token)
+
+    assert profile.statements == 1
+    assert profile.slowest_statement == "SELECT 1"
+    assert late_profile.statements == 0
@@ -0,0 +1,34 @@
+"""Source timeline lists weights once and only buckets and cells with appeals."""
+
+from fastapi.testclient import TestClient
+
+from src.services import StatisticsService
+
+
+def test_timeline_is_sparse(client: TestClient, source_id: int):
+    idle_source_id = client.post("/sources", json={"name": "Idle"}).json()["id"]
+    for i in range(3):
+        appeal = {"lead_external_id": f"lead-{i}", "source_id": source_id}
+        assert client.post("/appeals", json=appeal).status_code == 201
+
+    timeline = client.get("/statistics/sources/timeline", params={"granularity": "day"}).json()
+
+    assert [source["id"] for source in timeline["sources"]] == [source_id, idle_source_id]
+    assert timeline["sources"][0]["operators"][0]["expected_percent"] == 100
+    assert len(timeline["buckets"]) == 1
+    [bucket] = timeline["buckets"]
+    assert [source["source_id"] for source in bucket["sources"]] == [source_id]
+    assert bucket["sources"][0]["total_contacts"] == 3
+    assert [cell["actual_percent"] for cell in bucket["sources"][0]["operators"]] == [100]
+
+
+def test_timeline_rejects_range_with_too_many_cells(
+    client: TestClient, source_id: int, monkeypatch
+):
+    monkeypatch.setattr(StatisticsService, "MAX_TIMELINE_CELLS", 0)
+    appeal = {"lead_external_id": "lead-1", "source_id": source_id}
+    assert client.post("/appeals", json=appeal).status_code == 201
+
+    response = client.get("/statistics/sources/timeline")
+
+    assert response.status_code == 400